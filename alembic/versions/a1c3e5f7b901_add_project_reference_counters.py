@@ -0,0 +1,48 @@
+"""add project reference counters
+
+Revision ID: a1c3e5f7b901
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1c3e5f7b901'
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'perdix_mp_project_reference_counters',
+        sa.Column('year', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('last_value', sa.BigInteger(), nullable=False),
+        sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('year'),
+    )
+
+    # Seed counters from the highest reference ID already issued per year
+    if sa.inspect(op.get_bind()).has_table('perdix_mp_projects'):
+        op.execute(
+            """
+            INSERT INTO perdix_mp_project_reference_counters (year, last_value)
+            SELECT split_part(project_reference_id, '-', 2)::integer,
+                   max(split_part(project_reference_id, '-', 3)::bigint)
+            FROM perdix_mp_projects
+            WHERE project_reference_id ~ '^PROJ-[0-9]{4}-[0-9]+$'
+            GROUP BY 1
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('perdix_mp_project_reference_counters')
@@ -0,0 +1,64 @@
+"""add project listing indexes
+
+Revision ID: b2d4f6a8c013
+Revises: a1c3e5f7b901
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d4f6a8c013'
+down_revision: Union[str, Sequence[str], None] = 'a1c3e5f7b901'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PROJECT_INDEXES = [
+    ('idx_perdix_mp_projects_created_at_id', ['created_at', 'id'], None),
+    ('idx_perdix_mp_projects_organization_id_created_at', ['organization_id', 'created_at', 'id'], None),
+    ('idx_perdix_mp_projects_organization_type_created_at', ['organization_type', 'created_at', 'id'], None),
+    ('idx_perdix_mp_projects_status_created_at', ['status', 'created_at', 'id'], None),
+    ('idx_perdix_mp_projects_marketplace_created_at', ['created_at', 'id'], "status = 'active' AND visibility = 'public'"),
+]
+
+DRAFT_INDEXES = [
+    ('idx_perdix_mp_project_drafts_created_by_updated_at', ['created_by', sa.text('updated_at DESC'), sa.text('id DESC')]),
+    ('idx_perdix_mp_project_drafts_updated_at_id', ['updated_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the tables writable while the indexes build
+    with op.get_context().autocommit_block():
+        for name, columns, where in PROJECT_INDEXES:
+            op.create_index(
+                name,
+                'perdix_mp_projects',
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, columns in DRAFT_INDEXES:
+            op.create_index(
+                name,
+                'perdix_mp_project_drafts',
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(DRAFT_INDEXES):
+            op.drop_index(name, table_name='perdix_mp_project_drafts', postgresql_concurrently=True, if_exists=True)
+        for name, _, _ in reversed(PROJECT_INDEXES):
+            op.drop_index(name, table_name='perdix_mp_projects', postgresql_concurrently=True, if_exists=True)
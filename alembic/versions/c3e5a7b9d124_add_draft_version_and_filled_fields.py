@@ -0,0 +1,62 @@
+"""add draft version and filled_fields
+
+Revision ID: c3e5a7b9d124
+Revises: b2d4f6a8c013
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e5a7b9d124'
+down_revision: Union[str, Sequence[str], None] = 'b2d4f6a8c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Bit order of filled_fields (ProjectDraftService COMPLETION_FIELDS), with
+# how "filled" is tested for each column type
+TEXT, NUMBER, DATE = "text", "number", "date"
+COMPLETION_FIELDS = [
+    ('organization_type', TEXT), ('organization_id', TEXT), ('title', TEXT), ('contact_person', TEXT),
+    ('contact_person_designation', TEXT), ('contact_person_email', TEXT), ('contact_person_phone', TEXT), ('department', TEXT),
+    ('category', TEXT), ('description', TEXT), ('start_date', DATE), ('end_date', DATE),
+    ('state', TEXT), ('city', TEXT), ('ward', TEXT), ('total_project_cost', NUMBER),
+    ('funding_requirement', NUMBER), ('already_secured_funds', NUMBER), ('fundraising_start_date', DATE), ('fundraising_end_date', DATE),
+    ('municipality_credit_rating', TEXT), ('municipality_credit_score', NUMBER), ('project_stage', TEXT), ('visibility', TEXT),
+]
+
+FILLED_TESTS = {
+    TEXT: "COALESCE({column}, '') <> ''",
+    NUMBER: "COALESCE({column}, 0) <> 0",
+    DATE: "{column} IS NOT NULL",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'perdix_mp_project_drafts',
+        sa.Column('filled_fields', sa.Integer(), server_default='0', nullable=False)
+    )
+    op.add_column(
+        'perdix_mp_project_drafts',
+        sa.Column('version', sa.Integer(), server_default='1', nullable=False)
+    )
+
+    # Backfill the bitmask from the columns already saved
+    mask = " + ".join(
+        f"(CASE WHEN {FILLED_TESTS[kind].format(column=column)} THEN {1 << position} ELSE 0 END)"
+        for position, (column, kind) in enumerate(COMPLETION_FIELDS)
+    )
+    op.execute(f"UPDATE perdix_mp_project_drafts SET filled_fields = {mask}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('perdix_mp_project_drafts', 'version')
+    op.drop_column('perdix_mp_project_drafts', 'filled_fields')
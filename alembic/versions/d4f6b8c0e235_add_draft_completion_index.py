@@ -0,0 +1,68 @@
+"""add draft completion index
+
+Revision ID: d4f6b8c0e235
+Revises: c3e5a7b9d124
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f6b8c0e235'
+down_revision: Union[str, Sequence[str], None] = 'c3e5a7b9d124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Number of completion fields in filled_fields (all weighted 1 at this revision)
+COMPLETION_FIELD_COUNT = 24
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination on completion_percentage needs it NOT NULL
+    filled = " + ".join(f"((filled_fields >> {position}) & 1)" for position in range(COMPLETION_FIELD_COUNT))
+    op.execute(
+        "UPDATE perdix_mp_project_drafts "
+        f"SET completion_percentage = ROUND(({filled})::numeric * 100 / {COMPLETION_FIELD_COUNT}, 2) "
+        "WHERE completion_percentage IS NULL"
+    )
+    op.alter_column(
+        'perdix_mp_project_drafts',
+        'completion_percentage',
+        existing_type=sa.Numeric(5, 2),
+        server_default='0',
+        nullable=False,
+    )
+
+    # CONCURRENTLY keeps the table writable while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_perdix_mp_project_drafts_created_by_completion',
+            'perdix_mp_project_drafts',
+            ['created_by', sa.text('completion_percentage DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_perdix_mp_project_drafts_created_by_completion',
+            table_name='perdix_mp_project_drafts',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.alter_column(
+        'perdix_mp_project_drafts',
+        'completion_percentage',
+        existing_type=sa.Numeric(5, 2),
+        server_default=None,
+        nullable=True,
+    )
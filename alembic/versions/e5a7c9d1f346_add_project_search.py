@@ -0,0 +1,80 @@
+"""add project search
+
+Revision ID: e5a7c9d1f346
+Revises: d4f6b8c0e235
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9d1f346'
+down_revision: Union[str, Sequence[str], None] = 'd4f6b8c0e235'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Project.search_vector at this revision
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(category, '') || ' ' || coalesce(department, '') || ' ' || "
+    "coalesce(city, '') || ' ' || coalesce(state, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+# The trigram indexes are also in database_schema_with_prefix.sql, hence IF NOT EXISTS
+TRIGRAM_INDEXES = [
+    ('idx_perdix_mp_projects_title_trgm', 'title'),
+    ('idx_perdix_mp_projects_description_trgm', 'description'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # A stored generated column is recomputed by Postgres on every write.
+    # Adding it rewrites perdix_mp_projects once, under an exclusive lock.
+    op.add_column(
+        'perdix_mp_projects',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True)
+    )
+
+    # CONCURRENTLY keeps the table writable while the indexes build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_perdix_mp_projects_search_vector',
+            'perdix_mp_projects',
+            ['search_vector'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                'perdix_mp_projects',
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The trigram indexes (and pg_trgm) may predate this revision, so they stay
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_perdix_mp_projects_search_vector',
+            table_name='perdix_mp_projects',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column('perdix_mp_projects', 'search_vector')
@@ -0,0 +1,53 @@
+"""make listing keys not null
+
+Revision ID: f6b8d0e2a457
+Revises: e5a7c9d1f346
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b8d0e2a457'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c9d1f346'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, keyset column, fallback for rows where it is NULL)
+LISTING_KEYS = [
+    ('perdix_mp_projects', 'created_at', 'COALESCE(updated_at, now())'),
+    ('perdix_mp_project_drafts', 'updated_at', 'COALESCE(created_at, now())'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keyset pagination compares (column, id) tuples: NULL keys would be
+    # skipped by every page and cannot be encoded in a cursor
+    for table, column, fallback in LISTING_KEYS:
+        op.execute(f"UPDATE {table} SET {column} = {fallback} WHERE {column} IS NULL")
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.TIMESTAMP(timezone=True),
+            existing_server_default=sa.text('now()'),
+            nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, _ in reversed(LISTING_KEYS):
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.TIMESTAMP(timezone=True),
+            existing_server_default=sa.text('now()'),
+            nullable=True,
+        )
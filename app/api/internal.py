@@ -0,0 +1,40 @@
+"""
+Operational endpoints for monitoring, kept out of the public API
+"""
+import os
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from app.core.config import settings
+from app.core.database import async_pool_metrics, replica_pool_metrics, replica_set, sync_pool_metrics
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def require_metrics_token(credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer)) -> None:
+    """Allow the request only with the configured METRICS_TOKEN; 404 when none is configured"""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(credentials.credentials, settings.METRICS_TOKEN):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+internal_router = APIRouter(include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+
+
+@internal_router.get("/metrics/db-pool")
+async def db_pool_metrics():
+    # Per worker: each response describes the process that served it
+    return {
+        "pid": os.getpid(),
+        "pools": [async_pool_metrics.snapshot(), sync_pool_metrics.snapshot()]
+        + [metrics.snapshot() for metrics in replica_pool_metrics],
+        "replicas": replica_set.snapshot(),
+    }
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
+from app.core.perdix_client import PerdixClient, get_perdix_client
 from app.services.auth_service import obtain_jwt_from_perdix, request_password_otp_from_perdix, change_password_with_otp
 from app.schemas.auth import ChangePasswordWithOTP
 
@@ -8,11 +9,11 @@ router = APIRouter()
 
 
 @router.post("/login")
-def login(body: dict):
+async def login(body: dict, client: PerdixClient = Depends(get_perdix_client)):
     login_data = body.get("loginData")
     skip_relogin = body.get("skip_relogin", "yes")
 
-    auth_data, auth_status, auth_is_json = obtain_jwt_from_perdix(login_data, skip_relogin)
+    auth_data, auth_status, auth_is_json = await obtain_jwt_from_perdix(client, login_data, skip_relogin)
     if auth_status != 200:
         message = (auth_data or {}).get("error") if isinstance(auth_data, dict) else auth_data
         return JSONResponse({"message": message}, status_code=401)
@@ -21,12 +22,12 @@ def login(body: dict):
 
 
 @router.post("/forgot-password/otp")
-def request_forgot_password_otp(body: dict):
+async def request_forgot_password_otp(body: dict, client: PerdixClient = Depends(get_perdix_client)):
     user_id = body.get("userId") or body.get("login")
     if not user_id:
         return JSONResponse({"status": "error", "message": "userId is required"}, status_code=422)
 
-    body, status_code, is_json = request_password_otp_from_perdix(user_id)
+    body, status_code, is_json = await request_password_otp_from_perdix(client, user_id)
     content = body if is_json else {"raw": body}
     # normalize success message
     if 200 <= status_code < 300:
@@ -35,12 +36,13 @@ def request_forgot_password_otp(body: dict):
 
 
 @router.post("/change-password/otp")
-def change_password_with_otp_endpoint(password_data: ChangePasswordWithOTP):
+async def change_password_with_otp_endpoint(password_data: ChangePasswordWithOTP, client: PerdixClient = Depends(get_perdix_client)):
     """Change password using OTP verification"""
     if password_data.newPassword != password_data.confirmPassword:
         raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="New password and confirm password do not match")
 
-    body, status_code, is_json = change_password_with_otp(
+    body, status_code, is_json = await change_password_with_otp(
+        client,
         otp=password_data.otp,
         user_id=password_data.userId,
         new_password=password_data.newPassword,
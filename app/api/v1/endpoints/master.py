@@ -1,40 +1,41 @@
-from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.services.master_service import fetch_roles_from_perdix, MasterService
-from app.schemas.master import ProjectCategoryMasterResponse, ProjectStageMasterResponse, MasterListResponse
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.responses import JSONResponse, Response
+from app.core.perdix_client import PerdixClient, get_perdix_client
+from app.services.master_service import fetch_roles_from_perdix, get_master_snapshot, MasterSnapshot
+from app.schemas.master import MasterListResponse
 
 
 router = APIRouter()
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _master_response(request: Request, snapshot: MasterSnapshot) -> Response:
+    """Serve a pre-serialized master list, or 304 if the client's copy is current"""
+    headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=snapshot.body, media_type="application/json", headers=headers)
+
+
 @router.get("/roles")
-def get_roles():
-    body, status_code, is_json = fetch_roles_from_perdix()
+async def get_roles(client: PerdixClient = Depends(get_perdix_client)):
+    body, status_code, is_json = await fetch_roles_from_perdix(client)
     return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
 
 
 @router.get("/project-categories", response_model=MasterListResponse, status_code=status.HTTP_200_OK)
-def get_project_categories(db: Session = Depends(get_db)):
-    """Get all project categories from master table"""
-    service = MasterService(db)
-    categories = service.get_all_project_categories()
-    return {
-        "status": "success",
-        "message": "Project categories fetched successfully",
-        "data": categories
-    }
+async def get_project_categories(request: Request):
+    """Get all project categories from master table (served from memory)"""
+    return _master_response(request, await get_master_snapshot("project_categories"))
 
 
 @router.get("/project-stages", response_model=MasterListResponse, status_code=status.HTTP_200_OK)
-def get_project_stages(db: Session = Depends(get_db)):
-    """Get all project stages from master table"""
-    service = MasterService(db)
-    stages = service.get_all_project_stages()
-    return {
-        "status": "success",
-        "message": "Project stages fetched successfully",
-        "data": stages
-    }
-
+async def get_project_stages(request: Request):
+    """Get all project stages from master table (served from memory)"""
+    return _master_response(request, await get_master_snapshot("project_stages"))
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
+from app.core.perdix_client import PerdixClient, get_perdix_client
 from app.schemas.organization import OrganizationCreate, OrganizationUpdate, OrganizationResponse, OrganizationListResponse
 from app.services.organization_service import (
     create_organization_in_perdix,
@@ -12,10 +13,10 @@ router = APIRouter()
 
 
 @router.post("/organizations", status_code=status.HTTP_201_CREATED)
-def create_organization(payload: OrganizationCreate):
+async def create_organization(payload: OrganizationCreate, client: PerdixClient = Depends(get_perdix_client)):
     """Create a new organization (branch in Perdix)"""
     try:
-        body, status_code, is_json = create_organization_in_perdix(payload)
+        body, status_code, is_json = await create_organization_in_perdix(client, payload)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
@@ -27,10 +28,10 @@ def create_organization(payload: OrganizationCreate):
 
 
 @router.put("/organizations/{organization_id}", status_code=status.HTTP_200_OK)
-def update_organization(organization_id: int, payload: OrganizationUpdate):
+async def update_organization(organization_id: int, payload: OrganizationUpdate, client: PerdixClient = Depends(get_perdix_client)):
     """Update an existing organization (branch in Perdix)"""
     try:
-        body, status_code, is_json = update_organization_in_perdix(organization_id, payload)
+        body, status_code, is_json = await update_organization_in_perdix(client, organization_id, payload)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
@@ -42,10 +43,10 @@ def update_organization(organization_id: int, payload: OrganizationUpdate):
 
 
 @router.put("/organizations", status_code=status.HTTP_200_OK)
-def update_organization_raw(payload: dict):
+async def update_organization_raw(payload: dict, client: PerdixClient = Depends(get_perdix_client)):
     """Update organization (branch) using raw payload from frontend (must include id, version, branchCode, etc.)."""
     try:
-        body, status_code, is_json = update_organization_in_perdix_raw(payload)
+        body, status_code, is_json = await update_organization_in_perdix_raw(client, payload)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
@@ -57,10 +58,10 @@ def update_organization_raw(payload: dict):
 
 
 @router.get("/organizations", status_code=status.HTTP_200_OK)
-def get_organizations():
+async def get_organizations(client: PerdixClient = Depends(get_perdix_client)):
     """Get all organizations (branches from Perdix)"""
     try:
-        body, status_code, is_json = get_organizations_from_perdix()
+        body, status_code, is_json = await get_organizations_from_perdix(client)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
@@ -1,30 +1,34 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
-from app.core.database import get_db
+from app.core.database import get_async_db, get_async_read_db
+from fastapi.responses import JSONResponse
+from app.core.serialization import FastJSONResponse, rows_to_dicts
 from app.schemas.project_draft import (
     ProjectDraftCreate, 
     ProjectDraftUpdate, 
+    ProjectDraftAutosave,
+    ProjectDraftBatchSubmit,
     ProjectDraftResponse, 
     ProjectDraftListResponse
 )
 from app.schemas.project import ProjectResponse
-from app.services.project_draft_service import ProjectDraftService
+from app.services.project_draft_service import DRAFT_RESPONSE_FIELDS, ProjectDraftService, autosave_draft
 from app.services.project_service import ProjectService
 
 router = APIRouter()
 
 
 @router.post("/", response_model=dict, status_code=status.HTTP_201_CREATED)
-def create_draft(
+async def create_draft(
     draft_data: ProjectDraftCreate, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: Optional[str] = None  # TODO: Get from authenticated user context
 ):
     """Create a new project draft"""
     try:
         service = ProjectDraftService(db)
-        draft = service.create_draft(draft_data, user_id=user_id)
+        draft = await service.create_draft(draft_data, user_id=user_id)
         draft_response = ProjectDraftResponse.model_validate(draft)
         return {
             "status": "success",
@@ -41,23 +45,39 @@ def create_draft(
 
 
 @router.get("/", response_model=ProjectDraftListResponse, status_code=status.HTTP_200_OK)
-def get_drafts(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+async def get_drafts(
+    skip: int = Query(0, ge=0, description="Number of records to skip (deprecated, prefer cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor/prev_cursor from a previous page"),
+    total: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total to return: exact (cached), estimate or none"),
     user_id: Optional[str] = Query(None, description="Filter by user ID"),  # TODO: Get from auth context
-    db: Session = Depends(get_db)
+    min_completion: Optional[float] = Query(None, ge=0, le=100, description="Only drafts at least this complete (percent)"),
+    order_by: str = Query("updated_at", pattern="^(updated_at|completion)$", description="Sort by updated_at or completion, highest first"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get list of project drafts"""
     try:
         service = ProjectDraftService(db)
-        drafts, total = service.get_drafts(user_id=user_id, skip=skip, limit=limit)
-        drafts_response = [ProjectDraftResponse.model_validate(draft) for draft in drafts]
-        return {
+        page = await service.get_drafts(
+            user_id=user_id,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total,
+            min_completion=min_completion,
+            order_by=order_by
+        )
+        # Rows come straight from the database: skip pydantic and encode with orjson
+        return FastJSONResponse({
             "status": "success",
             "message": "Drafts fetched successfully",
-            "data": drafts_response,
-            "total": total
-        }
+            "data": rows_to_dicts(page.items, DRAFT_RESPONSE_FIELDS),
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -66,15 +86,15 @@ def get_drafts(
 
 
 @router.get("/{draft_id}", response_model=dict, status_code=status.HTTP_200_OK)
-def get_draft(
+async def get_draft(
     draft_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: Optional[str] = None  # TODO: Get from authenticated user context
 ):
     """Get draft by ID"""
     try:
         service = ProjectDraftService(db)
-        draft = service.get_draft_by_id(draft_id, user_id=user_id)
+        draft = await service.get_draft_by_id(draft_id, user_id=user_id)
         draft_response = ProjectDraftResponse.model_validate(draft)
         return {
             "status": "success",
@@ -91,16 +111,16 @@ def get_draft(
 
 
 @router.put("/{draft_id}", response_model=dict, status_code=status.HTTP_200_OK)
-def update_draft(
+async def update_draft(
     draft_id: int,
     draft_data: ProjectDraftUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: Optional[str] = None  # TODO: Get from authenticated user context
 ):
     """Update an existing draft"""
     try:
         service = ProjectDraftService(db)
-        draft = service.update_draft(draft_id, draft_data, user_id=user_id)
+        draft = await service.update_draft(draft_id, draft_data, user_id=user_id)
         draft_response = ProjectDraftResponse.model_validate(draft)
         return {
             "status": "success",
@@ -116,16 +136,43 @@ def update_draft(
         )
 
 
+@router.patch("/{draft_id}", response_model=dict, status_code=status.HTTP_200_OK)
+async def autosave_project_draft(
+    draft_id: int,
+    autosave: ProjectDraftAutosave,
+    user_id: Optional[str] = None  # TODO: Get from authenticated user context
+):
+    """Autosave only the changed fields of a draft.
+
+    Send the ``version`` from the last response; a 409 means the draft was
+    saved elsewhere since then and must be reloaded.
+    """
+    try:
+        saved = await autosave_draft(draft_id, autosave, user_id=user_id)
+        return FastJSONResponse({
+            "status": "success",
+            "message": "Draft autosaved successfully",
+            "data": saved
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to autosave draft: {str(e)}"
+        )
+
+
 @router.delete("/{draft_id}", status_code=status.HTTP_200_OK)
-def delete_draft(
+async def delete_draft(
     draft_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: Optional[str] = None  # TODO: Get from authenticated user context
 ):
     """Delete a draft"""
     try:
         service = ProjectDraftService(db)
-        service.delete_draft(draft_id, user_id=user_id)
+        await service.delete_draft(draft_id, user_id=user_id)
         return {
             "status": "success",
             "message": "Draft deleted successfully"
@@ -139,37 +186,80 @@ def delete_draft(
         )
 
 
+@router.post("/submit", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def submit_drafts(
+    payload: ProjectDraftBatchSubmit,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: Optional[str] = None  # TODO: Get from authenticated user context
+):
+    """Submit several drafts at once, with a per-draft result
+    
+    All valid drafts become projects in a single transaction; drafts that
+    are missing or fail validation are reported and kept for fixing.
+    """
+    try:
+        draft_service = ProjectDraftService(db)
+        submitted, errors = await draft_service.submit_drafts(payload.draft_ids, user_id=user_id)
+        total = len(submitted) + len(errors)
+        result = {
+            "total": total,
+            "succeeded": len(submitted),
+            "failed": len(errors),
+            "projects": [
+                {"draft_id": item["draft_id"], "project": ProjectResponse.model_validate(item["project"])}
+                for item in submitted
+            ],
+            "errors": errors
+        }
+        if not submitted:
+            return JSONResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                content={
+                    "status": "failed",
+                    "message": f"No drafts submitted; {len(errors)} of {total} drafts rejected",
+                    "data": result
+                }
+            )
+        return {
+            "status": "success" if not errors else "partial_success",
+            "message": f"{len(submitted)} of {total} drafts submitted",
+            "data": result
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to submit drafts: {str(e)}"
+        )
+
+
 @router.post("/{draft_id}/submit", response_model=dict, status_code=status.HTTP_201_CREATED)
-def submit_draft(
+async def submit_draft(
     draft_id: int,
     draft_data: Optional[ProjectDraftUpdate] = None,  # Optional: allows updating draft before submission
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: Optional[str] = None  # TODO: Get from authenticated user context
 ):
-    """Submit draft - converts draft to project using existing project creation API
+    """Submit draft - converts draft to project and deletes the draft
     
     This endpoint:
     1. Optionally updates draft with provided data (if draft_data is provided)
     2. Validates draft exists and user has access
     3. Validates all required fields are present
-    4. Creates project using existing project creation API
-    5. Deletes draft after successful project creation
+    4. Creates the project and deletes the draft
     
-    If draft_data is provided, the draft will be updated before validation and submission.
-    This allows fixing validation errors and resubmitting in a single call.
+    All steps run in one transaction. If draft_data is provided, the draft is
+    updated before validation, so validation errors can be fixed and the draft
+    resubmitted in a single call.
     
-    If project creation fails, the draft is preserved for retry.
+    If project creation fails, the draft is preserved (without draft_data) for retry.
     """
     try:
         draft_service = ProjectDraftService(db)
         
-        # If draft_data is provided, update the draft first
-        # This allows users to fix validation errors and resubmit in one call
-        if draft_data is not None:
-            draft_service.update_draft(draft_id, draft_data, user_id=user_id)
-        
         # Use the service method which handles all error scenarios
-        project = draft_service.submit_draft(draft_id, user_id=user_id)
+        project = await draft_service.submit_draft(draft_id, user_id=user_id, draft_data=draft_data)
         
         # Return created project
         project_response = ProjectResponse.model_validate(project)
@@ -1,18 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse
-from app.services.project_service import ProjectService
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, File, HTTPException, status, Query, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db, get_async_read_db
+from app.core.serialization import FastJSONResponse, rows_to_dicts
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectListResponse, ProjectSearchResponse
+from app.services.project_service import PROJECT_RESPONSE_FIELDS, ProjectService, resolve_project_fields
+from app.services.project_export_service import EXPORT_FORMATS, stream_project_export
+from app.services.project_import_service import IMPORT_FORMATS, ProjectImportService, detect_import_format
+from app.services.project_search_service import ProjectSearchService
 
 router = APIRouter()
 
 
 @router.post("/", response_model=dict, status_code=status.HTTP_201_CREATED)
-def create_project(project_data: ProjectCreate, db: Session = Depends(get_db)):
+async def create_project(project_data: ProjectCreate, db: AsyncSession = Depends(get_async_db)):
     """Create a new project"""
     try:
         service = ProjectService(db)
-        project = service.create_project(project_data)
+        project = await service.create_project(project_data)
         # Convert SQLAlchemy model to Pydantic schema
         project_response = ProjectResponse.model_validate(project)
         return {
@@ -29,12 +36,143 @@ def create_project(project_data: ProjectCreate, db: Session = Depends(get_db)):
         )
 
 
+@router.post("/import", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def import_projects(
+    file: UploadFile = File(..., description="CSV (with header row) or JSON Lines file of projects"),
+    format: Optional[str] = Query(None, description=f"File format: {' or '.join(IMPORT_FORMATS)} (default: from file name)"),
+    all_or_nothing: bool = Query(False, description="Import nothing if any row is invalid"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Bulk-create projects from an uploaded file with a per-row error report"""
+    try:
+        if format is not None and format not in IMPORT_FORMATS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid format. Must be one of: {', '.join(IMPORT_FORMATS)}"
+            )
+        fmt = format or detect_import_format(file.filename, file.content_type)
+        service = ProjectImportService(db)
+        result = await service.import_projects(file.file, fmt, all_or_nothing=all_or_nothing)
+        if result["succeeded"] == 0:
+            return JSONResponse(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                content={
+                    "status": "failed",
+                    "message": f"No projects imported; {result['failed']} of {result['total']} rows rejected",
+                    "data": result
+                }
+            )
+        return {
+            "status": "success" if result["failed"] == 0 else "partial_success",
+            "message": f"{result['succeeded']} of {result['total']} projects imported",
+            "data": result
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to import projects: {str(e)}"
+        )
+    finally:
+        await file.close()
+
+
+@router.get("/export", status_code=status.HTTP_200_OK)
+async def export_projects(
+    format: str = Query("csv", pattern="^(csv|jsonl)$", description="Export format: csv or jsonl"),
+    organization_id: str = Query(None, description="Filter by organization ID"),
+    organization_type: str = Query(None, description="Filter by organization type"),
+    status: str = Query(None, description="Filter by project status"),
+    visibility: str = Query(None, description="Filter by project visibility")
+):
+    """Stream all matching projects as CSV or JSON Lines (same filters as the list endpoint)"""
+    try:
+        chunks = stream_project_export(
+            format,
+            organization_id=organization_id,
+            organization_type=organization_type,
+            status=status,
+            visibility=visibility
+        )
+        # Start the query now so database errors still get a proper error response
+        first_chunk = await chunks.__anext__()
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to export projects: {str(e)}"
+        )
+
+    async def body():
+        yield first_chunk
+        async for chunk in chunks:
+            yield chunk
+
+    filename = f"projects-{datetime.now(timezone.utc):%Y%m%d-%H%M%S}.{format}"
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/search", response_model=ProjectSearchResponse, status_code=status.HTTP_200_OK)
+async def search_projects(
+    q: str = Query(..., min_length=2, max_length=200, description="Search text (supports \"phrases\", OR and -term)"),
+    state: str = Query(None, description="Filter by state"),
+    city: str = Query(None, description="Filter by city"),
+    category: str = Query(None, description="Filter by category"),
+    status: str = Query(None, description="Filter by project status"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor/prev_cursor from a previous page"),
+    total: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total to return: exact (cached), estimate or none"),
+    fields: Optional[str] = Query(None, description="'summary' or comma-separated fields to return (default: all)"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Search projects by relevance, with matched terms highlighted"""
+    try:
+        selected_fields = resolve_project_fields(fields)
+        service = ProjectSearchService(db)
+        page = await service.search(
+            q,
+            state=state,
+            city=city,
+            category=category,
+            status=status,
+            limit=limit,
+            cursor=cursor,
+            total_mode=total,
+            fields=selected_fields
+        )
+        projects = rows_to_dicts([row[0] for row in page.items], selected_fields or PROJECT_RESPONSE_FIELDS)
+        for project, (_, rank, title_highlight, description_highlight) in zip(projects, page.items):
+            project["rank"] = float(rank)
+            project["highlights"] = {"title": title_highlight, "description": description_highlight or None}
+        return FastJSONResponse({
+            "status": "success",
+            "message": "Projects searched successfully",
+            "data": projects,
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor
+        })
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to search projects: {str(e)}"
+        )
+
+
 @router.get("/{project_id}", response_model=dict, status_code=status.HTTP_200_OK)
-def get_project(project_id: int, db: Session = Depends(get_db)):
+async def get_project(project_id: int, db: AsyncSession = Depends(get_async_read_db)):
     """Get project by ID"""
     try:
         service = ProjectService(db)
-        project = service.get_project_by_id(project_id)
+        project = await service.get_project_by_id(project_id)
         # Convert SQLAlchemy model to Pydantic schema
         project_response = ProjectResponse.model_validate(project)
         return {
@@ -52,11 +190,11 @@ def get_project(project_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/reference/{project_reference_id}", response_model=dict, status_code=status.HTTP_200_OK)
-def get_project_by_reference(project_reference_id: str, db: Session = Depends(get_db)):
+async def get_project_by_reference(project_reference_id: str, db: AsyncSession = Depends(get_async_read_db)):
     """Get project by reference ID"""
     try:
         service = ProjectService(db)
-        project = service.get_project_by_reference_id(project_reference_id)
+        project = await service.get_project_by_reference_id(project_reference_id)
         # Convert SQLAlchemy model to Pydantic schema
         project_response = ProjectResponse.model_validate(project)
         return {
@@ -74,34 +212,44 @@ def get_project_by_reference(project_reference_id: str, db: Session = Depends(ge
 
 
 @router.get("/", response_model=ProjectListResponse, status_code=status.HTTP_200_OK)
-def get_projects(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+async def get_projects(
+    skip: int = Query(0, ge=0, description="Number of records to skip (deprecated, prefer cursor)"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor/prev_cursor from a previous page"),
+    total: str = Query("exact", pattern="^(exact|estimate|none)$", description="Total to return: exact (cached), estimate or none"),
     organization_id: str = Query(None, description="Filter by organization ID"),
     organization_type: str = Query(None, description="Filter by organization type"),
     status: str = Query(None, description="Filter by project status"),
     visibility: str = Query(None, description="Filter by project visibility"),
-    db: Session = Depends(get_db)
+    fields: Optional[str] = Query(None, description="'summary' or comma-separated fields to return (default: all)"),
+    db: AsyncSession = Depends(get_async_read_db)
 ):
     """Get list of projects with optional filters and pagination"""
     try:
+        selected_fields = resolve_project_fields(fields)
         service = ProjectService(db)
-        projects, total = service.get_projects(
+        page = await service.get_projects(
             skip=skip,
             limit=limit,
             organization_id=organization_id,
             organization_type=organization_type,
             status=status,
-            visibility=visibility
+            visibility=visibility,
+            cursor=cursor,
+            total_mode=total,
+            fields=selected_fields
         )
-        # Convert SQLAlchemy models to Pydantic schemas
-        projects_response = [ProjectResponse.model_validate(project) for project in projects]
-        return {
+        # Rows come straight from the database: skip pydantic and encode with orjson
+        return FastJSONResponse({
             "status": "success",
             "message": "Projects fetched successfully",
-            "data": projects_response,
-            "total": total
-        }
+            "data": rows_to_dicts(page.items, selected_fields or PROJECT_RESPONSE_FIELDS),
+            "total": page.total,
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor
+        })
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -110,11 +258,11 @@ def get_projects(
 
 
 @router.put("/{project_id}", response_model=dict, status_code=status.HTTP_200_OK)
-def update_project(project_id: int, project_data: ProjectUpdate, db: Session = Depends(get_db)):
+async def update_project(project_id: int, project_data: ProjectUpdate, db: AsyncSession = Depends(get_async_db)):
     """Update an existing project"""
     try:
         service = ProjectService(db)
-        project = service.update_project(project_id, project_data)
+        project = await service.update_project(project_id, project_data)
         # Convert SQLAlchemy model to Pydantic schema
         project_response = ProjectResponse.model_validate(project)
         return {
@@ -132,11 +280,11 @@ def update_project(project_id: int, project_data: ProjectUpdate, db: Session = D
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_200_OK)
-def delete_project(project_id: int, db: Session = Depends(get_db)):
+async def delete_project(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete a project"""
     try:
         service = ProjectService(db)
-        service.delete_project(project_id)
+        await service.delete_project(project_id)
         return {
             "status": "success",
             "message": "Project deleted successfully"
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
+from app.core.perdix_client import PerdixClient, get_perdix_client
 from app.schemas.user_role import UserRoleCreate, UserRoleUpdate, UserRoleResponse, UserRoleListResponse
 from app.services.user_role_service import (
     create_user_role_in_perdix,
@@ -11,10 +12,10 @@ router = APIRouter()
 
 
 @router.post("/roles", status_code=status.HTTP_201_CREATED)
-def create_user_role(payload: UserRoleCreate):
+async def create_user_role(payload: UserRoleCreate, client: PerdixClient = Depends(get_perdix_client)):
     """Create a new user role"""
     try:
-        body, status_code, is_json = create_user_role_in_perdix(payload)
+        body, status_code, is_json = await create_user_role_in_perdix(client, payload)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
@@ -26,10 +27,10 @@ def create_user_role(payload: UserRoleCreate):
 
 
 @router.put("/roles/{role_id}", status_code=status.HTTP_200_OK)
-def update_user_role(role_id: int, payload: UserRoleUpdate):
+async def update_user_role(role_id: int, payload: UserRoleUpdate, client: PerdixClient = Depends(get_perdix_client)):
     """Update an existing user role"""
     try:
-        body, status_code, is_json = update_user_role_in_perdix(role_id, payload)
+        body, status_code, is_json = await update_user_role_in_perdix(client, role_id, payload)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
@@ -41,10 +42,10 @@ def update_user_role(role_id: int, payload: UserRoleUpdate):
 
 
 @router.get("/roles", status_code=status.HTTP_200_OK)
-def get_user_roles():
+async def get_user_roles(client: PerdixClient = Depends(get_perdix_client)):
     """Get all user roles"""
     try:
-        body, status_code, is_json = get_user_roles_from_perdix()
+        body, status_code, is_json = await get_user_roles_from_perdix(client)
         return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
     except HTTPException:
         raise
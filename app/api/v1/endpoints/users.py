@@ -4,20 +4,23 @@ from typing import List, Optional
 from app.core.database import get_db
 from passlib.context import CryptContext
 from app.core.config import settings
-from app.services.user_service import register_user_with_optional_roles, get_users_from_perdix, get_user_from_perdix_by_login, update_user_in_perdix
+from app.core.perdix_client import PerdixClient, get_perdix_client
+from app.services.user_service import register_user_with_optional_roles, register_users_bulk, get_users_from_perdix, get_user_from_perdix_by_login, update_user_in_perdix, user_profile_cache
+from app.schemas.user import BulkUserRegister
 from fastapi.responses import JSONResponse
 
 router = APIRouter()
 
 
 @router.get("/perdix", status_code=status.HTTP_200_OK)
-def get_perdix_users(
+async def get_perdix_users(
     branch_name: Optional[str] = Query(None, description="Filter users by branch name"),
     page: int = Query(1, ge=1, description="Page number for pagination"),
-    per_page: int = Query(10, ge=1, le=100, description="Number of items per page")
+    per_page: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    client: PerdixClient = Depends(get_perdix_client)
 ):
     """Get users list from Perdix API with pagination and optional branch filter"""
-    body, status_code, is_json = get_users_from_perdix(branch_name=branch_name, page=page, per_page=per_page)
+    body, status_code, is_json = await get_users_from_perdix(client, branch_name=branch_name, page=page, per_page=per_page)
     
     if status_code != 200:
         raise HTTPException(
@@ -31,10 +34,19 @@ def get_perdix_users(
         "data": body if is_json else {"raw": body}
     }
 
+@router.get("/perdix/cache/stats", status_code=status.HTTP_200_OK)
+async def get_perdix_user_cache_stats():
+    """Hit/miss counters of this worker's Perdix user profile cache"""
+    return {
+        "status": "success",
+        "message": "User profile cache stats fetched successfully",
+        "data": user_profile_cache.stats()
+    }
+
 @router.get("/perdix/{login}", status_code=status.HTTP_200_OK)
-def get_perdix_user_by_login(login: str):
+async def get_perdix_user_by_login(login: str, client: PerdixClient = Depends(get_perdix_client)):
     """Get single user details from Perdix by login/username"""
-    body, status_code, is_json = get_user_from_perdix_by_login(login)
+    body, status_code, is_json = await get_user_from_perdix_by_login(client, login)
 
     if status_code != 200:
         raise HTTPException(
@@ -49,9 +61,9 @@ def get_perdix_user_by_login(login: str):
     }
 
 @router.get("/perdix/userid/{userid}", status_code=status.HTTP_200_OK)
-def get_perdix_user_by_userid(userid: str):
+async def get_perdix_user_by_userid(userid: str, client: PerdixClient = Depends(get_perdix_client)):
     """Alias: Get Perdix user by userId (mapped to login)"""
-    body, status_code, is_json = get_user_from_perdix_by_login(userid)
+    body, status_code, is_json = await get_user_from_perdix_by_login(client, userid)
 
     if status_code != 200:
         raise HTTPException(
@@ -66,7 +78,26 @@ def get_perdix_user_by_userid(userid: str):
     }
 
 @router.put("/perdix", status_code=status.HTTP_200_OK)
-def update_perdix_user(payload: dict):
+async def update_perdix_user(payload: dict, client: PerdixClient = Depends(get_perdix_client)):
     """Forward user update to Perdix (PUT /api/users)"""
-    body, status_code, is_json = update_user_in_perdix(payload)
+    body, status_code, is_json = await update_user_in_perdix(client, payload)
     return JSONResponse(content=body if is_json else {"raw": body}, status_code=status_code)
+
+@router.post("/perdix/bulk", status_code=status.HTTP_200_OK)
+async def register_perdix_users_bulk(payload: BulkUserRegister, client: PerdixClient = Depends(get_perdix_client)):
+    """Register many users in Perdix (create + optional role assignment) with per-user results"""
+    result = await register_users_bulk(client, payload.users, concurrency=settings.PERDIX_BULK_REGISTER_CONCURRENCY)
+    if result["succeeded"] == 0:
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={
+                "status": "failed",
+                "message": f"No users registered; {result['failed']} of {result['total']} failed",
+                "data": result
+            }
+        )
+    return {
+        "status": "success" if result["failed"] == 0 else "partial_success",
+        "message": f"{result['succeeded']} of {result['total']} users registered in Perdix",
+        "data": result
+    }
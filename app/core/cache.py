@@ -0,0 +1,142 @@
+"""
+In-process async caching helpers
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple, Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger("core.cache")
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class _Entry(NamedTuple):
+    value: Any
+    loaded_at: float
+    ttl: float
+    stale_ttl: float
+    negative: bool
+
+
+class AsyncTTLCache:
+    """Per-worker async cache with TTL and stale-while-revalidate.
+
+    - Entries younger than ``ttl`` are served directly.
+    - Entries younger than ``ttl + stale_ttl`` are served immediately while a
+      background task refreshes them.
+    - Concurrent misses for the same key share a single loader call.
+    - Values matching ``negative`` (e.g. 404s) are kept for ``negative_ttl``.
+    - With ``maxsize`` set, the least recently used entry is evicted.
+    - ``on_store`` is called with (key, value) whenever a fresh value is
+      stored, so derived state only ever follows what the cache holds.
+    - ``invalidate`` drops entries and discards loads started before it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        cacheable: Optional[Callable[[Any], bool]] = None,
+        negative: Optional[Callable[[Any], bool]] = None,
+        negative_ttl: float = 0.0,
+        maxsize: Optional[int] = None,
+        on_store: Optional[Callable[[Hashable, Any], None]] = None,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self._cacheable = cacheable or (lambda value: True)
+        self._negative = negative or (lambda value: False)
+        self._on_store = on_store
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats = {"hits": 0, "stale_hits": 0, "negative_hits": 0, "misses": 0, "evictions": 0}
+
+    async def get_or_load(self, key: Hashable, loader: Loader) -> Any:
+        """Return the cached value for key, calling loader on a miss"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = time.monotonic() - entry.loaded_at
+            if age < entry.ttl:
+                self._entries.move_to_end(key)
+                self._stats["negative_hits" if entry.negative else "hits"] += 1
+                return entry.value
+            if age < entry.ttl + entry.stale_ttl:
+                # Serve stale and refresh in the background
+                self._entries.move_to_end(key)
+                self._stats["stale_hits"] += 1
+                self._start_load(key, loader)
+                return entry.value
+
+        self._stats["misses"] += 1
+        # Shield so a cancelled caller does not cancel the shared load
+        return await asyncio.shield(self._start_load(key, loader))
+
+    async def refresh(self, key: Hashable, loader: Loader) -> Any:
+        """Reload key now regardless of its age (still single-flight)"""
+        return await asyncio.shield(self._start_load(key, loader))
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key (or everything) and ignore results of in-flight loads"""
+        if key is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+        logger.debug(f"Cache '{self.name}' invalidated: {key if key is not None else 'all keys'}")
+
+    def stats(self) -> dict:
+        """Counters since startup plus current size"""
+        return {"name": self.name, "size": len(self._entries), **self._stats}
+
+    def _start_load(self, key: Hashable, loader: Loader) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._on_load_done(key, done))
+        return task
+
+    async def _load(self, key: Hashable, loader: Loader) -> Any:
+        value = await loader()
+        # invalidate() unregisters in-flight loads; their results are not stored
+        if self._inflight.get(key) is not asyncio.current_task():
+            return value
+        if self._cacheable(value):
+            self._store(key, _Entry(value, time.monotonic(), self.ttl, self.stale_ttl, False))
+            if self._on_store is not None:
+                self._on_store(key, value)
+        elif self._negative(value):
+            self._store(key, _Entry(value, time.monotonic(), self.negative_ttl, 0.0, True))
+        return value
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _on_load_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Cache '{self.name}' load for {key!r} failed: {task.exception()}")
+
+
+def is_success_response(result: tuple) -> bool:
+    """Only cache successful (body, status_code, is_json) Perdix results"""
+    return result[1] == 200
+
+
+def is_not_found_response(result: tuple) -> bool:
+    """Perdix 404 results, suitable for negative caching"""
+    return result[1] == 404
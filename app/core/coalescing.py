@@ -0,0 +1,86 @@
+"""
+Coalescing of bursty writes to the same record
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from app.core.logging import get_logger
+
+logger = get_logger("core.coalescing")
+
+# Called with the merged changes and the result of the write the batch
+# queued behind (None if it was written straight away or that write failed)
+Writer = Callable[[dict, Any], Awaitable[Any]]
+
+
+class _Batch:
+    __slots__ = ("changes", "task")
+
+    def __init__(self, changes: dict):
+        self.changes = changes
+        self.task: Optional[asyncio.Task] = None
+
+
+class WriteCoalescer:
+    """Per-worker merging of writes that arrive while one is in flight.
+
+    A ``submit`` for a key with no write in flight is written straight
+    away. Submits for the key while that write runs open one follow-up
+    batch: their changes merge into it (later values win), it is written
+    once the in-flight write finishes, and every caller in it gets the
+    result of that one write. A lone save therefore never waits. With
+    ``enabled`` False each submit writes on its own.
+    """
+
+    def __init__(self, name: str, enabled: bool = True):
+        self.name = name
+        self.enabled = enabled
+        self._in_flight: Dict[Hashable, _Batch] = {}
+        self._pending: Dict[Hashable, _Batch] = {}
+        self._stats = {"writes": 0, "coalesced": 0}
+
+    async def submit(self, key: Hashable, changes: dict, write: Writer) -> Any:
+        """Write changes for key, or merge them into the batch queued behind its in-flight write"""
+        if not self.enabled:
+            self._stats["writes"] += 1
+            return await write(changes, None)
+
+        batch = self._pending.get(key)
+        if batch is not None:
+            batch.changes.update(changes)
+            self._stats["coalesced"] += 1
+        else:
+            batch = _Batch(dict(changes))
+            previous = self._in_flight.get(key)
+            if previous is None:
+                self._in_flight[key] = batch
+            else:
+                self._pending[key] = batch
+            batch.task = asyncio.create_task(self._write(key, batch, previous, write))
+            batch.task.add_done_callback(self._on_write_done)
+        # Shield so one cancelled caller does not cancel the shared write
+        return await asyncio.shield(batch.task)
+
+    def stats(self) -> dict:
+        """Counters since startup plus writes in flight and batches queued behind them"""
+        return {"name": self.name, "in_flight": len(self._in_flight), "pending": len(self._pending), **self._stats}
+
+    async def _write(self, key: Hashable, batch: _Batch, previous: Optional[_Batch], write: Writer) -> Any:
+        previous_result = None
+        if previous is not None:
+            await asyncio.wait([previous.task])
+            if not previous.task.cancelled() and previous.task.exception() is None:
+                previous_result = previous.task.result()
+            # Submits from here on queue behind this batch
+            del self._pending[key]
+            self._in_flight[key] = batch
+        try:
+            self._stats["writes"] += 1
+            return await write(batch.changes, previous_result)
+        finally:
+            if self._in_flight.get(key) is batch:
+                del self._in_flight[key]
+
+    def _on_write_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"Coalesced write '{self.name}' failed: {task.exception()}")
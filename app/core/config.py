@@ -27,6 +27,27 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "root"
     POSTGRES_DB: str = "munify_db"
     SQL_ECHO: bool = False  # SQLAlchemy echo setting
+    # Connection pools (per worker: size + overflow of both engines counts against max_connections)
+    DB_POOL_SIZE: int = 10  # Async pool connections kept open per worker
+    DB_MAX_OVERFLOW: int = 20  # Extra connections allowed under burst load
+    DB_SYNC_POOL_SIZE: int = 5  # Sync pool (legacy endpoints, scripts)
+    DB_SYNC_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 300  # Seconds before a pooled connection is replaced
+    DB_POOL_PRE_PING: bool = True  # Test connections on checkout (False: rely on recycle and retry)
+    DB_STATEMENT_TIMEOUT_MS: int = 30000  # Server-side statement_timeout, 0 disables
+    # Read replicas (same credentials and database name as the primary)
+    DB_REPLICA_HOSTS: List[str] = []  # "host" or "host:port"; empty keeps all reads on the primary
+    DB_REPLICA_MAX_LAG_SECONDS: float = 2.0  # Replicas further behind are skipped
+    DB_REPLICA_CHECK_INTERVAL: float = 5.0  # Seconds between replica lag checks
+    METRICS_TOKEN: str = ""  # Bearer token for the internal /metrics endpoints; empty disables them
+    LIST_TOTAL_CACHE_TTL: float = 30.0  # Seconds an exact list total is reused per worker
+    LIST_TOTAL_CACHE_MAX_ENTRIES: int = 1000  # Filter sets (or searches) whose totals are kept per worker, per listing
+    PROJECT_IMPORT_MAX_ROWS: int = 5000  # Largest CSV/JSONL file accepted by the bulk project import
+    PROJECT_EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round trip in project exports
+    DRAFT_AUTOSAVE_COALESCE: bool = True  # Merge autosaves that arrive while a save of the same draft is being written
+    MASTER_CACHE_TTL: float = 300.0  # Seconds master lists are served before a background refresh
+    MASTER_CACHE_STALE_TTL: float = 86400.0  # Extra seconds a stale master list is served while refreshing
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080","http://localhost:5173"]
@@ -36,10 +57,38 @@ class Settings(BaseSettings):
     PERDIX_JWT: str =secret_key;
     PERDIX_PAGE_URI: str = "Page/Engine/user.UserMaintanence"
     PERDIX_ORIGIN: str = "https://uat-lp.perdix.co.in"
+    PERDIX_HTTP2: bool = True  # Multiplex calls over HTTP/2 when the server supports it
+    PERDIX_TIMEOUT: float = 30.0  # Seconds, read/write timeout
+    PERDIX_CONNECT_TIMEOUT: float = 5.0  # Seconds
+    PERDIX_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free pooled connection
+    PERDIX_MAX_CONNECTIONS: int = 100  # Connection pool size per worker
+    PERDIX_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    PERDIX_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept open
+    # Per-endpoint circuit breaker and bulkhead around Perdix calls
+    PERDIX_BREAKER_WINDOW: int = 20  # Number of recent calls evaluated
+    PERDIX_BREAKER_MIN_CALLS: int = 10  # Calls needed before the breaker can open
+    PERDIX_BREAKER_FAILURE_RATE: float = 0.5  # Share of transport errors/5xx that opens the breaker
+    PERDIX_BREAKER_SLOW_CALL_SECONDS: float = 10.0  # Calls slower than this count as slow
+    PERDIX_BREAKER_SLOW_CALL_RATE: float = 0.5  # Share of slow calls that opens the breaker
+    PERDIX_BREAKER_OPEN_SECONDS: float = 30.0  # Fail-fast period before half-open probing
+    PERDIX_BREAKER_HALF_OPEN_CALLS: int = 2  # Successful probes needed to close again
+    PERDIX_BULKHEAD_MAX_CONCURRENT: int = 20  # In-flight calls per Perdix endpoint
+    PERDIX_BULKHEAD_MAX_WAIT: float = 1.0  # Seconds to wait for a slot before failing with 503
+    PERDIX_ROLE_CACHE_TTL: float = 300.0  # Seconds the role catalog is served without refresh
+    PERDIX_ROLE_CACHE_STALE_TTL: float = 3600.0  # Extra seconds a stale catalog is served while refreshing
+    PERDIX_ORG_CACHE_TTL: float = 600.0  # Seconds the branch list is served without refresh
+    PERDIX_ORG_CACHE_STALE_TTL: float = 3600.0
+    PERDIX_ORG_REFRESH_INTERVAL: float = 300.0  # Background refresh period of the organization directory
+    PERDIX_ORG_VALIDATE_IDS: bool = False  # Reject organization_ids missing from the directory (may lag Perdix by the refresh period)
+    PERDIX_USER_CACHE_TTL: float = 60.0  # Seconds a user profile is served without refresh
+    PERDIX_USER_CACHE_STALE_TTL: float = 300.0
+    PERDIX_USER_CACHE_NEGATIVE_TTL: float = 30.0  # Seconds a 404 for a login is remembered
+    PERDIX_USER_CACHE_MAXSIZE: int = 10000  # Max profiles kept per worker (LRU)
+    PERDIX_BULK_REGISTER_CONCURRENCY: int = 10  # Users registered in parallel by the bulk endpoint
 
     FRONTEND_ORIGIN: str = "http://localhost:5173"
     
-    @field_validator("BACKEND_CORS_ORIGINS", mode="before")
+    @field_validator("BACKEND_CORS_ORIGINS", "DB_REPLICA_HOSTS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]):
         if isinstance(v, str) and not v.startswith("["):
@@ -1,23 +1,105 @@
+import asyncio
+import sys
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
+from app.core.db_metrics import PoolMetrics, timed_pool_class
+from app.core.db_routing import ReplicaSet, routing_session_class
+
+# psycopg's async driver cannot run on the default Windows ProactorEventLoop
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+
+
+def _database_url(host: str, port: int) -> str:
+    return (
+        f"postgresql+psycopg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
+        f"@{host}:{port}/{settings.POSTGRES_DB}"
+    )
+
 
 # Create PostgreSQL connection string
-SQLALCHEMY_DATABASE_URL = (
-    f"postgresql+psycopg://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
-    f"@{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
+SQLALCHEMY_DATABASE_URL = _database_url(settings.POSTGRES_HOST, settings.POSTGRES_PORT)
+
+# Server-side statement timeout applied to every pooled connection
+DB_CONNECT_ARGS = (
+    {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+    if settings.DB_STATEMENT_TIMEOUT_MS else {}
 )
 
+# Per-worker pool metrics, exposed at /metrics/db-pool
+sync_pool_metrics = PoolMetrics("sync", settings.DB_SYNC_POOL_SIZE, settings.DB_SYNC_MAX_OVERFLOW)
+async_pool_metrics = PoolMetrics("async", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
+    poolclass=timed_pool_class(QueuePool, sync_pool_metrics),
+    pool_size=settings.DB_SYNC_POOL_SIZE,
+    max_overflow=settings.DB_SYNC_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=DB_CONNECT_ARGS,
     echo=settings.SQL_ECHO  # Use setting from config
 )
+sync_pool_metrics.instrument(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers: concurrency is bounded by this pool,
+# not by the threadpool that runs sync endpoints
+async_engine = create_async_engine(
+    SQLALCHEMY_DATABASE_URL,
+    poolclass=timed_pool_class(AsyncAdaptedQueuePool, async_pool_metrics),
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    connect_args=DB_CONNECT_ARGS,
+    echo=settings.SQL_ECHO
+)
+async_pool_metrics.instrument(async_engine.sync_engine)
+
+
+def _replica_engine(host: str):
+    host, _, port = host.partition(":")
+    metrics = PoolMetrics(f"replica:{host}", settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
+    replica = create_async_engine(
+        _database_url(host, int(port or settings.POSTGRES_PORT)),
+        poolclass=timed_pool_class(AsyncAdaptedQueuePool, metrics),
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=DB_CONNECT_ARGS,
+        echo=settings.SQL_ECHO
+    )
+    metrics.instrument(replica.sync_engine)
+    replica_pool_metrics.append(metrics)
+    return replica
+
+
+# Replicas serve reads of sessions from get_async_read_db (see db_routing)
+replica_pool_metrics = []
+replica_set = ReplicaSet(
+    [_replica_engine(host) for host in settings.DB_REPLICA_HOSTS],
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+)
+
+# expire_on_commit=False so committed objects can still be serialized
+# without an implicit (and, in async, illegal) lazy reload
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    sync_session_class=routing_session_class(replica_set),
+    autoflush=False,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 # Dependency to get database session
@@ -27,3 +109,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# Dependency to get an async database session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# Dependency for read-mostly endpoints: reads may be served by a healthy
+# replica until the session writes, after which it stays on the primary
+async def get_async_read_db():
+    async with AsyncSessionLocal(info={"replica_reads": True}) as db:
+        yield db
@@ -0,0 +1,111 @@
+"""
+Connection pool metrics, kept per worker process
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from typing import Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool
+
+from app.core.logging import get_logger
+
+logger = get_logger("core.db_metrics")
+
+# Upper bounds (seconds) of the checkout wait histogram buckets; the last bucket is +Inf
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class PoolMetrics:
+    """Checkout wait histogram and error counters for one engine's pool.
+
+    Gauges (checked out, overflow, ...) are read live from the pool; the
+    histogram and counters accumulate since the worker started.
+    """
+
+    def __init__(self, name: str, pool_size: int, max_overflow: int):
+        self.name = name
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self._engine: Engine = None
+        # Sync engine checkouts happen on threadpool threads
+        self._lock = threading.Lock()
+        self._wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self._wait_sum = 0.0
+        self._wait_count = 0
+        self._counters = {"connects": 0, "checkout_timeouts": 0, "pre_ping_failures": 0, "invalidations": 0}
+
+    def instrument(self, engine: Engine) -> None:
+        """Attach event listeners to a (sync) engine and its pool"""
+        self._engine = engine
+        event.listen(engine, "handle_error", self._on_handle_error)
+        # Pool listeners survive engine.dispose(), which recreates the pool
+        event.listen(engine.pool, "connect", lambda *args: self._increment("connects"))
+        event.listen(engine.pool, "invalidate", lambda *args: self._increment("invalidations"))
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._wait_buckets[bisect_left(WAIT_BUCKETS, seconds)] += 1
+            self._wait_sum += seconds
+            self._wait_count += 1
+
+    def _increment(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _on_handle_error(self, context) -> None:
+        if context.is_pre_ping:
+            self._increment("pre_ping_failures")
+
+    def snapshot(self) -> dict:
+        pool = self._engine.pool if self._engine is not None else None
+        with self._lock:
+            cumulative, buckets = 0, {}
+            for bound, count in zip(WAIT_BUCKETS + ("+Inf",), self._wait_buckets):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            return {
+                "name": self.name,
+                "pid": os.getpid(),
+                "pool_size": self.pool_size,
+                "max_overflow": self.max_overflow,
+                "max_connections": self.pool_size + self.max_overflow,
+                "checked_out": pool.checkedout() if pool is not None else 0,
+                "checked_in": pool.checkedin() if pool is not None else 0,
+                # SQLAlchemy reports overflow as negative until the pool is full
+                "open_connections": pool.size() + pool.overflow() if pool is not None else 0,
+                "overflow": max(pool.overflow(), 0) if pool is not None else 0,
+                "checkout_wait_seconds": {
+                    "buckets": buckets,
+                    "sum": round(self._wait_sum, 6),
+                    "count": self._wait_count,
+                },
+                **self._counters,
+            }
+
+
+def timed_pool_class(base: Type[Pool], metrics: PoolMetrics) -> Type[Pool]:
+    """Subclass of ``base`` that records how long each checkout waits.
+
+    Pool.recreate() instantiates ``self.__class__``, so the timing survives
+    engine.dispose().
+    """
+
+    class TimedPool(base):
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                return super().connect()
+            except PoolTimeoutError:
+                metrics._increment("checkout_timeouts")
+                logger.warning(f"Connection pool '{metrics.name}' exhausted after {time.perf_counter() - started:.2f}s")
+                raise
+            finally:
+                metrics.observe_wait(time.perf_counter() - started)
+
+    TimedPool.__name__ = f"Timed{base.__name__}"
+    return TimedPool
@@ -0,0 +1,141 @@
+"""
+Read-replica routing for async sessions
+"""
+import asyncio
+import itertools
+import time
+from typing import List, Optional, Type
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.core.logging import get_logger
+
+logger = get_logger("core.db_routing")
+
+# Seconds the replica is behind; 0 when it has replayed everything it received
+REPLICA_LAG_SQL = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+    " END"
+)
+
+
+class ReplicaSet:
+    """Replica engines with health tracked by a periodic lag check.
+
+    Only replicas whose last check succeeded within ``max_lag`` seconds are
+    handed out (round-robin); with none healthy, callers fall back to the
+    primary. Replicas start unhealthy until their first check.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], max_lag: float):
+        self.engines = engines
+        self.max_lag = max_lag
+        self._healthy: List[Engine] = []
+        self._lag: List[Optional[float]] = [None] * len(engines)
+        self._checked_at: List[Optional[float]] = [None] * len(engines)
+        self._round_robin = itertools.count()
+
+    def pick(self) -> Optional[Engine]:
+        """Next healthy replica (sync engine, as Session.get_bind expects) or None"""
+        healthy = self._healthy
+        if not healthy:
+            return None
+        return healthy[next(self._round_robin) % len(healthy)]
+
+    async def check(self) -> None:
+        healthy = []
+        for index, engine in enumerate(self.engines):
+            try:
+                async with engine.connect() as conn:
+                    lag = await conn.scalar(REPLICA_LAG_SQL)
+                lag = float(lag) if lag is not None else None
+            except Exception as e:
+                logger.warning(f"Replica {engine.url.host} lag check failed: {str(e)}")
+                lag = None
+            self._lag[index] = lag
+            self._checked_at[index] = time.time()
+            if lag is not None and lag <= self.max_lag:
+                healthy.append(engine.sync_engine)
+            elif lag is not None:
+                logger.warning(f"Replica {engine.url.host} is {lag:.1f}s behind; reads go elsewhere")
+        self._healthy = healthy
+
+    async def monitor(self, interval: float) -> None:
+        """Re-check replica lag forever (run as a background task)"""
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for engine in self.engines:
+            await engine.dispose()
+
+    def snapshot(self) -> list:
+        healthy = set(self._healthy)
+        return [
+            {
+                "host": engine.url.host,
+                "port": engine.url.port,
+                "healthy": engine.sync_engine in healthy,
+                "lag_seconds": self._lag[index],
+                "checked_at": self._checked_at[index],
+            }
+            for index, engine in enumerate(self.engines)
+        ]
+
+
+def routing_session_class(replicas: ReplicaSet) -> Type[Session]:
+    """Session class that sends reads of replica-enabled sessions to replicas.
+
+    A session may use replicas only when created with
+    ``info={"replica_reads": True}``. Flushes, INSERT/UPDATE/DELETE and
+    SELECT ... FOR UPDATE always go to the primary, and once a session has
+    written, all of its later reads do too (read-your-writes).
+
+    The replica is picked once, on the session's first read, and kept until
+    the session closes, so e.g. a listing's count and page queries see the
+    same snapshot and only one replica pool is used per session.
+    """
+
+    class RoutingSession(Session):
+        def get_bind(self, mapper=None, clause=None, **kw):
+            if self.info.get("replica_reads") and not self.info.get("primary"):
+                if self._flushing or isinstance(clause, UpdateBase) or getattr(clause, "_for_update_arg", None) is not None:
+                    self.info["primary"] = True
+                else:
+                    replica = self.info.get("replica")
+                    if replica is None:
+                        replica = replicas.pick()
+                    if replica is not None:
+                        self.info["replica"] = replica
+                        return replica
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        def close(self) -> None:
+            super().close()
+            # A reused session picks a replica afresh
+            self.info.pop("replica", None)
+
+    @event.listens_for(RoutingSession, "after_flush")
+    def _stick_to_primary(session, flush_context):
+        session.info["primary"] = True
+
+    return RoutingSession
+
+
+def pin_to_primary(session) -> bool:
+    """Route the session's remaining reads to the primary.
+
+    Returns True if earlier reads may have come from a replica, i.e. a miss
+    is worth retrying (the row may simply not have replicated yet).
+    """
+    retry = "replica" in session.info and not session.info.get("primary")
+    session.info["primary"] = True
+    return retry
@@ -9,7 +9,7 @@ from app.core.logging import get_logger
 logger = get_logger("exceptions")
 
 
-def http_exception_handler(request: Request, exc: StarletteHTTPException):
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     logger.error(f"HTTP Exception: {exc.status_code} - {exc.detail}")
     return JSONResponse(
         status_code=exc.status_code,
@@ -20,7 +20,7 @@ def http_exception_handler(request: Request, exc: StarletteHTTPException):
     )
 
 
-def request_validation_exception_handler(request: Request, exc: RequestValidationError):
+async def request_validation_exception_handler(request: Request, exc: RequestValidationError):
     logger.error(f"Validation Error: {exc.errors()}")
     return JSONResponse(
         status_code=422,
@@ -32,7 +32,7 @@ def request_validation_exception_handler(request: Request, exc: RequestValidatio
     )
 
 
-def unhandled_exception_handler(request: Request, exc: Exception):
+async def unhandled_exception_handler(request: Request, exc: Exception):
     logger.error(f"Unhandled Exception: {str(exc)}", exc_info=True)
     return JSONResponse(
         status_code=500,
@@ -44,7 +44,7 @@ def unhandled_exception_handler(request: Request, exc: Exception):
     )
 
 
-def integrity_error_handler(request: Request, exc: IntegrityError):
+async def integrity_error_handler(request: Request, exc: IntegrityError):
     """Handle database integrity violations like unique constraint errors."""
     error_msg = str(getattr(exc, "orig", exc))
     logger.error(f"Integrity Error: {error_msg}")
@@ -67,7 +67,7 @@ def integrity_error_handler(request: Request, exc: IntegrityError):
     )
 
 
-def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
+async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
     """Catch-all for other SQLAlchemy errors."""
     logger.error(f"SQLAlchemy Error: {str(exc)}", exc_info=True)
     return JSONResponse(
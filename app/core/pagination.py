@@ -0,0 +1,173 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints
+"""
+import base64
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Tuple, Union
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logging import get_logger
+
+logger = get_logger("core.pagination")
+
+
+class Page(NamedTuple):
+    items: list
+    total: Optional[int]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+# How a cursor's sort value is read back, by the sort column's Python type
+CURSOR_PARSERS: Dict[type, Callable[[str], object]] = {
+    datetime: datetime.fromisoformat,
+    Decimal: Decimal,
+}
+
+
+def encode_cursor(direction: str, sort_value: Union[datetime, Decimal], row_id: int) -> str:
+    """Opaque, URL-safe cursor for the (sort_value, id) position of a row"""
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else str(sort_value)
+    payload = json.dumps([direction, value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse: Callable[[str], object] = datetime.fromisoformat) -> Tuple[str, object, int]:
+    """Inverse of encode_cursor; raises 400 for anything it did not produce"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        direction, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return direction, parse(sort_value), int(row_id)
+    except (ValueError, TypeError, InvalidOperation):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        )
+
+
+async def keyset_paginate(
+    db: AsyncSession,
+    query: Select,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+) -> Tuple[list, Optional[str], Optional[str]]:
+    """Return (rows, next_cursor, prev_cursor) for a newest-first listing.
+
+    Rows are ordered by (sort_column DESC, id_column DESC); the cursor holds
+    the last (or first) row's key, so every page is an index range scan on
+    (sort_column, id_column) no matter how deep the client has scrolled.
+    ``skip`` is only honoured without a cursor, for legacy offset clients.
+    sort_column must be NOT NULL and of a type in CURSOR_PARSERS.
+    """
+    direction = "next"
+    if cursor:
+        direction, sort_value, row_id = decode_cursor(cursor, CURSOR_PARSERS[sort_column.type.python_type])
+        position = tuple_(sort_column, id_column)
+        if direction == "next":
+            query = query.where(position < tuple_(sort_value, row_id))
+        else:
+            query = query.where(position > tuple_(sort_value, row_id))
+
+    if direction == "next":
+        query = query.order_by(sort_column.desc(), id_column.desc())
+        if skip and not cursor:
+            query = query.offset(skip)
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # Fetch one extra row to learn whether another page exists
+    rows = list((await db.scalars(query.limit(limit + 1))).all())
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if direction == "prev":
+        rows.reverse()
+    if not rows:
+        return rows, None, None
+
+    def _cursor(row_direction: str, row) -> str:
+        return encode_cursor(row_direction, getattr(row, sort_column.key), getattr(row, id_column.key))
+
+    has_next = has_more if direction == "next" else True
+    has_prev = bool(cursor or skip) if direction == "next" else has_more
+    next_cursor = _cursor("next", rows[-1]) if has_next else None
+    prev_cursor = _cursor("prev", rows[0]) if has_prev else None
+    return rows, next_cursor, prev_cursor
+
+
+async def exact_count(db: AsyncSession, query: Select) -> int:
+    """COUNT(*) over the filtered query"""
+    return await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+
+
+async def estimate_count(db: AsyncSession, query: Select) -> int:
+    """Planner row estimate for the query (no scan; may be off after bulk changes)"""
+    conn = await db.connection()
+    # Keep the filter values as bound parameters: rendered into the SQL they
+    # could contain anything, including text a SQL parser reads as a bind
+    compiled = query.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class CountCache:
+    """Per-worker cache of exact list totals, keyed by the filter set.
+
+    Totals are allowed to lag by up to ``ttl`` seconds; writes in this worker
+    call ``invalidate`` so its own creates and deletes show up immediately.
+    Keys come from client input, so at most ``maxsize`` entries are kept
+    (least recently used go first) and expired ones are dropped when seen.
+    """
+
+    def __init__(self, name: str, ttl: float, maxsize: int = 1000):
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[int, float]]" = OrderedDict()
+
+    async def get_or_count(self, key: Hashable, count: Callable[[], Awaitable[int]]) -> int:
+        entry = self._entries.get(key)
+        if entry is not None:
+            if time.monotonic() - entry[1] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[0]
+            del self._entries[key]
+        value = await count()
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        logger.debug(f"Count cache '{self.name}' invalidated")
+
+
+async def resolve_total(
+    db: AsyncSession,
+    query: Select,
+    total_mode: str,
+    count_cache: CountCache,
+    cache_key: Hashable,
+) -> Optional[int]:
+    """Total for a listing according to total_mode: exact (cached), estimate or none"""
+    if total_mode == "none":
+        return None
+    if total_mode == "estimate":
+        return await estimate_count(db, query)
+    return await count_cache.get_or_count(cache_key, lambda: exact_count(db, query))
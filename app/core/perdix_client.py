@@ -0,0 +1,155 @@
+"""
+Shared HTTP client for the external Perdix service
+"""
+import asyncio
+import time
+from typing import Any, Dict, Hashable, Optional
+
+import httpx
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.resilience import Bulkhead, BulkheadFullError, CircuitBreaker, CircuitOpenError
+
+logger = get_logger("core.perdix_client")
+
+
+class PerdixClient:
+    """Application-lifetime async client for Perdix calls.
+
+    Wraps a single pooled ``httpx.AsyncClient`` so that TCP/TLS connections are
+    reused across requests instead of being set up on every call. Each Perdix
+    endpoint gets its own circuit breaker and concurrency bulkhead, so a slow
+    upstream fails fast with 503 instead of tying up workers. Identical
+    concurrent GETs marked ``dedupe=True`` share one upstream request.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._client = httpx.AsyncClient(
+            http2=settings.PERDIX_HTTP2,
+            timeout=httpx.Timeout(
+                settings.PERDIX_TIMEOUT,
+                connect=settings.PERDIX_CONNECT_TIMEOUT,
+                pool=settings.PERDIX_POOL_TIMEOUT,
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.PERDIX_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.PERDIX_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.PERDIX_KEEPALIVE_EXPIRY,
+            ),
+            transport=transport,
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._bulkheads: Dict[str, Bulkhead] = {}
+        self._inflight_gets: Dict[Hashable, asyncio.Task] = {}
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(
+                endpoint,
+                window_size=settings.PERDIX_BREAKER_WINDOW,
+                min_calls=settings.PERDIX_BREAKER_MIN_CALLS,
+                failure_rate=settings.PERDIX_BREAKER_FAILURE_RATE,
+                slow_call_seconds=settings.PERDIX_BREAKER_SLOW_CALL_SECONDS,
+                slow_call_rate=settings.PERDIX_BREAKER_SLOW_CALL_RATE,
+                open_seconds=settings.PERDIX_BREAKER_OPEN_SECONDS,
+                half_open_calls=settings.PERDIX_BREAKER_HALF_OPEN_CALLS,
+            )
+        return breaker
+
+    def _bulkhead(self, endpoint: str) -> Bulkhead:
+        bulkhead = self._bulkheads.get(endpoint)
+        if bulkhead is None:
+            bulkhead = self._bulkheads[endpoint] = Bulkhead(
+                endpoint,
+                max_concurrent=settings.PERDIX_BULKHEAD_MAX_CONCURRENT,
+                max_wait=settings.PERDIX_BULKHEAD_MAX_WAIT,
+            )
+        return bulkhead
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        json: Any = None,
+        endpoint: Optional[str] = None,
+    ) -> tuple:
+        """Send a request to Perdix and return (body, status_code, is_json)
+
+        ``endpoint`` names the breaker/bulkhead to use; pass a templated name
+        (e.g. "GET /api/users/{login}") for URLs that embed identifiers.
+        """
+        endpoint = endpoint or f"{method} {httpx.URL(url).path}"
+        breaker = self._breaker(endpoint)
+        try:
+            async with self._bulkhead(endpoint).slot(), breaker.call() as admitted:
+                started = time.monotonic()
+                try:
+                    response = await self._client.request(method, url, headers=headers, params=params, json=json)
+                except httpx.HTTPError as exc:
+                    admitted.record(failed=True, duration=time.monotonic() - started)
+                    # Network/transport error, not a Perdix application response
+                    logger.error(f"Perdix {method} {url} failed: {str(exc)}")
+                    raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
+                admitted.record(failed=response.status_code >= 500, duration=time.monotonic() - started)
+        except (CircuitOpenError, BulkheadFullError) as exc:
+            logger.warning(f"Perdix {endpoint} rejected: {str(exc)}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Perdix is temporarily unavailable. Please try again later.",
+            )
+
+        # Return raw Perdix response body and status for the caller to forward
+        try:
+            return response.json(), response.status_code, True
+        except ValueError:
+            return response.text, response.status_code, False
+
+    async def get(self, url: str, dedupe: bool = False, **kwargs) -> tuple:
+        """GET, optionally with in-flight deduplication.
+
+        With ``dedupe`` (only for idempotent reads), concurrent calls with the
+        same URL, params and headers (so the same credentials) await one
+        shared request and receive the same result. GETs with side effects,
+        such as triggering an OTP, must leave it off.
+        """
+        if not dedupe:
+            return await self.request("GET", url, **kwargs)
+        key = (
+            url,
+            tuple(sorted((k, str(v)) for k, v in (kwargs.get("params") or {}).items())),
+            tuple(sorted((kwargs.get("headers") or {}).items())),
+        )
+        task = self._inflight_gets.get(key)
+        if task is None:
+            task = asyncio.create_task(self.request("GET", url, **kwargs))
+            self._inflight_gets[key] = task
+            task.add_done_callback(lambda done: self._on_get_done(key, done))
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(task)
+
+    def _on_get_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight_gets.get(key) is task:
+            del self._inflight_gets[key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved even if every caller went away
+
+    async def post(self, url: str, **kwargs) -> tuple:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> tuple:
+        return await self.request("PUT", url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+# Dependency to get the shared Perdix client created in the app lifespan.
+# Declared async so FastAPI resolves it on the event loop, not in the threadpool.
+async def get_perdix_client(request: Request) -> PerdixClient:
+    return request.app.state.perdix_client
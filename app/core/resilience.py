@@ -0,0 +1,163 @@
+"""
+Circuit breaker and bulkhead primitives for upstream calls
+"""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Tuple
+
+from app.core.logging import get_logger
+
+logger = get_logger("core.resilience")
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class BulkheadFullError(Exception):
+    """Raised when no concurrency slot frees up within the allowed wait"""
+
+
+class AdmittedCall:
+    """One call let through by a CircuitBreaker; report its outcome with ``record``"""
+
+    __slots__ = ("breaker", "probe", "generation")
+
+    def __init__(self, breaker: "CircuitBreaker", probe: bool, generation: int):
+        self.breaker = breaker
+        self.probe = probe  # Admitted as a HALF_OPEN probe
+        self.generation = generation  # Breaker state period it was admitted in
+
+    def record(self, failed: bool, duration: float) -> None:
+        self.breaker._record(self, failed, duration)
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker with failure-rate and slow-call thresholds.
+
+    CLOSED: calls pass; the breaker opens once the last ``window_size`` calls
+    (at least ``min_calls``) exceed either rate threshold.
+    OPEN: calls are rejected for ``open_seconds``.
+    HALF_OPEN: up to ``half_open_calls`` probes pass; all must succeed to close,
+    any failure re-opens.
+    Outcomes count only in the state period the call was admitted in: a slow
+    call admitted while CLOSED that ends during HALF_OPEN is not a probe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        window_size: int,
+        min_calls: int,
+        failure_rate: float,
+        slow_call_seconds: float,
+        slow_call_rate: float,
+        open_seconds: float,
+        half_open_calls: int,
+    ):
+        self.name = name
+        self.window_size = window_size
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate = slow_call_rate
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.state = self.CLOSED
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)  # (failed, slow)
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        self._generation = 0  # Bumped on every state change
+
+    @asynccontextmanager
+    async def call(self) -> AsyncIterator[AdmittedCall]:
+        """Guard one call; the body must call ``record`` on the yielded AdmittedCall"""
+        self._before_call()
+        admitted = AdmittedCall(self, self.state == self.HALF_OPEN, self._generation)
+        try:
+            yield admitted
+        finally:
+            if admitted.probe and admitted.generation == self._generation:
+                self._probes_in_flight -= 1
+
+    def _record(self, admitted: AdmittedCall, failed: bool, duration: float) -> None:
+        if admitted.generation != self._generation:
+            # Admitted under an earlier state; its outcome says nothing about this one
+            return
+        slow = duration >= self.slow_call_seconds
+        if admitted.probe:
+            if failed or slow:
+                self._open()
+            else:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_calls:
+                    self._close()
+            return
+
+        self._outcomes.append((failed, slow))
+        if len(self._outcomes) < self.min_calls:
+            return
+        total = len(self._outcomes)
+        failures = sum(1 for f, _ in self._outcomes if f)
+        slow_calls = sum(1 for _, s in self._outcomes if s)
+        if failures / total >= self.failure_rate or slow_calls / total >= self.slow_call_rate:
+            self._open()
+
+    def _before_call(self) -> None:
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.open_seconds:
+                raise CircuitOpenError(f"Circuit '{self.name}' is open")
+            self.state = self.HALF_OPEN
+            self._generation += 1
+            self._probes_in_flight = 0
+            self._probe_successes = 0
+            logger.info(f"Circuit '{self.name}' half-open, probing upstream")
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.half_open_calls:
+                raise CircuitOpenError(f"Circuit '{self.name}' is half-open")
+            self._probes_in_flight += 1
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._generation += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        logger.warning(f"Circuit '{self.name}' opened for {self.open_seconds}s")
+
+    def _close(self) -> None:
+        self.state = self.CLOSED
+        self._generation += 1
+        self._outcomes.clear()
+        logger.info(f"Circuit '{self.name}' closed")
+
+
+class Bulkhead:
+    """Caps concurrent calls; waits at most ``max_wait`` seconds for a slot"""
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float):
+        self.name = name
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+        elif self.max_wait <= 0:
+            raise BulkheadFullError(f"Bulkhead '{self.name}' is full")
+        else:
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait)
+            except asyncio.TimeoutError:
+                raise BulkheadFullError(f"Bulkhead '{self.name}' is full")
+        try:
+            yield
+        finally:
+            self._semaphore.release()
@@ -0,0 +1,47 @@
+"""
+Fast JSON serialization for trusted database rows
+"""
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any, Iterable, List, Sequence
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _orjson_default(value: Any) -> Any:
+    # orjson handles str/int/float/bool/None, date and datetime natively
+    if isinstance(value, Decimal):
+        return str(value)  # Same as pydantic's JSON output for Decimal fields
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """orjson encoding matching pydantic's JSON output (Decimal as string, UTC as Z)"""
+    return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Returning one from an endpoint bypasses FastAPI's response_model
+    validation and jsonable_encoder, so only use it for content built from
+    trusted rows (see rows_to_dicts).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def rows_to_dicts(rows: Iterable[Any], fields: Sequence[str]) -> List[dict]:
+    """Read ``fields`` off ORM rows into plain dicts, without pydantic.
+
+    Meant for rows straight from the database, whose types already match
+    the response schema, so validating them again would be wasted work.
+    """
+    if len(fields) == 1:
+        # attrgetter with a single name returns a bare value, not a tuple
+        name = fields[0]
+        return [{name: getattr(row, name)} for row in rows]
+    getter = attrgetter(*fields)
+    return [dict(zip(fields, getter(row))) for row in rows]
@@ -1,9 +1,17 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.api.internal import internal_router
 from app.api.v1.api import api_router
 from app.core.config import settings
+from app.core.database import async_engine, async_pool_metrics, sync_pool_metrics, replica_set
 from app.core.logging import setup_logging, get_logger
+from app.core.perdix_client import PerdixClient
 from app.middleware.logging import RequestLoggingMiddleware
+from app.services.organization_service import refresh_organization_directory
+from app.services.master_service import warm_master_data
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
@@ -23,11 +31,50 @@ import app.models  # noqa: F401
 setup_logging()
 logger = get_logger("main")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled Perdix client per worker, shared by all requests
+    app.state.perdix_client = PerdixClient()
+    logger.info("Perdix client started")
+    logger.info(
+        f"DB pools for worker {os.getpid()}: up to "
+        f"{async_pool_metrics.pool_size + async_pool_metrics.max_overflow} async and "
+        f"{sync_pool_metrics.pool_size + sync_pool_metrics.max_overflow} sync connections"
+    )
+    # Keep the organization directory warm for network-free lookups
+    org_refresh = asyncio.create_task(
+        refresh_organization_directory(app.state.perdix_client, settings.PERDIX_ORG_REFRESH_INTERVAL)
+    )
+    # Load master lists in the background; early requests share the same load
+    master_warmup = asyncio.create_task(warm_master_data())
+    # Track replica lag so reads only go to replicas that are caught up
+    replica_monitor = None
+    if replica_set.engines:
+        replica_monitor = asyncio.create_task(replica_set.monitor(settings.DB_REPLICA_CHECK_INTERVAL))
+    try:
+        yield
+    finally:
+        background = [task for task in (org_refresh, master_warmup, replica_monitor) if task is not None]
+        for task in background:
+            task.cancel()
+        # Wait for every task even if one of them fails while stopping
+        for task, result in zip(background, await asyncio.gather(*background, return_exceptions=True)):
+            if isinstance(result, Exception):
+                logger.warning(f"Background task {task.get_coro().__qualname__} failed on shutdown: {str(result)}")
+        if replica_monitor is not None:
+            await replica_set.dispose()
+        await app.state.perdix_client.aclose()
+        logger.info("Perdix client closed")
+        await async_engine.dispose()
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     description="Munify Phase-1: Commitment-based municipal projects marketplace backend",
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Add middleware (order matters - first added is outermost)
@@ -43,6 +90,7 @@ app.add_middleware(
 )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(internal_router)
 
 @app.get("/")
 async def root():
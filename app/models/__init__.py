@@ -12,6 +12,7 @@ from app.models.project import Project
 from app.models.project_draft import ProjectDraft
 from app.models.project_category_master import ProjectCategoryMaster
 from app.models.project_stage_master import ProjectStageMaster
+from app.models.project_reference_counter import ProjectReferenceCounter
 
 # Export all models for convenience
 __all__ = [
@@ -20,5 +21,6 @@ __all__ = [
     "ProjectDraft",
     "ProjectCategoryMaster",
     "ProjectStageMaster",
+    "ProjectReferenceCounter",
 ]
 
@@ -1,8 +1,20 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, CheckConstraint
+from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, CheckConstraint, Computed, Index, text
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.dialects.postgresql import TIMESTAMP, TSVECTOR
 from app.core.database import Base
 
+# Text search configuration of search_vector; queries must use the same one
+SEARCH_CONFIG = "english"
+
+# Search document: title ranks above category/department/location, which
+# rank above the description
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(category, '') || ' ' || coalesce(department, '') || ' ' || "
+    f"coalesce(city, '') || ' ' || coalesce(state, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+)
+
 
 class Project(Base):
     __tablename__ = "perdix_mp_projects"
@@ -38,7 +50,11 @@ class Project(Base):
     total_project_cost = Column(Numeric(15, 2), nullable=True)
     funding_requirement = Column(Numeric(15, 2), nullable=False)
     already_secured_funds = Column(Numeric(15, 2), default=0, nullable=True)
-    commitment_gap = Column(Numeric(15, 2), nullable=True)  # Generated column - read-only
+    commitment_gap = Column(
+        Numeric(15, 2),
+        Computed("funding_requirement - already_secured_funds", persisted=True),
+        nullable=True
+    )  # Generated column - read-only
     currency = Column(String(10), default='INR', nullable=True)
     
     # Fundraising Timeline
@@ -55,7 +71,15 @@ class Project(Base):
     
     # Calculated Fields
     funding_raised = Column(Numeric(15, 2), default=0, nullable=True)
-    funding_percentage = Column(Numeric(5, 2), nullable=True)  # Generated column - read-only
+    funding_percentage = Column(
+        Numeric(5, 2),
+        Computed(
+            "CASE WHEN funding_requirement > 0 "
+            "THEN (funding_raised / funding_requirement * 100) ELSE 0 END",
+            persisted=True
+        ),
+        nullable=True
+    )  # Generated column - read-only
     
     # Source & Audit
     approved_at = Column(TIMESTAMP(timezone=True), nullable=True)
@@ -63,11 +87,20 @@ class Project(Base):
     admin_notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)  # Listing keyset column
     created_by = Column(String(255), nullable=True)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True)
     updated_by = Column(String(255), nullable=True)
     
+    # Full-text search document, kept up to date by Postgres
+    search_vector = Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True), nullable=True)
+    
+    # Read server defaults, onupdate values and generated columns back with
+    # INSERT/UPDATE ... RETURNING instead of a follow-up SELECT.
+    # search_vector is only used inside search queries
+    # (Project.__table__.c.search_vector), so it is never loaded or returned.
+    __mapper_args__ = {"eager_defaults": True, "exclude_properties": ["search_vector"]}
+    
     # Add check constraints
     __table_args__ = (
         CheckConstraint("project_stage IN ('planning', 'initiated', 'in_progress')", name="check_project_stage"),
@@ -76,5 +109,31 @@ class Project(Base):
             name="check_status"
         ),
         CheckConstraint("visibility IN ('private', 'public')", name="check_visibility"),
+        # Listing indexes: every filter combination orders by (created_at, id) desc
+        Index("idx_perdix_mp_projects_created_at_id", "created_at", "id"),
+        Index("idx_perdix_mp_projects_organization_id_created_at", "organization_id", "created_at", "id"),
+        Index("idx_perdix_mp_projects_organization_type_created_at", "organization_type", "created_at", "id"),
+        Index("idx_perdix_mp_projects_status_created_at", "status", "created_at", "id"),
+        # Marketplace listing (active + public)
+        Index(
+            "idx_perdix_mp_projects_marketplace_created_at",
+            "created_at",
+            "id",
+            postgresql_where=text("status = 'active' AND visibility = 'public'"),
+        ),
+        # Project search: full-text on search_vector, fuzzy (pg_trgm) on title/description
+        Index("idx_perdix_mp_projects_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "idx_perdix_mp_projects_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_perdix_mp_projects_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
     )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, BigInteger, String, DateTime, Date, Text, Numeric, CheckConstraint
+from sqlalchemy import Column, BigInteger, Integer, String, DateTime, Date, Text, Numeric, CheckConstraint, Index
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from app.core.database import Base
@@ -57,18 +57,34 @@ class ProjectDraft(Base):
     
     # Draft-specific fields
     last_saved_tab = Column(String(50), nullable=True)  # Track which tab was last saved: 'tab1', 'tab2', 'tab3'
-    completion_percentage = Column(Numeric(5, 2), default=0, nullable=True)  # 0-100
+    completion_percentage = Column(Numeric(5, 2), default=0, server_default="0", nullable=False)  # 0-100
+    filled_fields = Column(Integer, default=0, server_default="0", nullable=False)  # Bitmask over COMPLETION_FIELDS
+    
+    # Optimistic concurrency: bumped by every write, which only applies to the version it was based on
+    version = Column(Integer, server_default="1", nullable=False)
     
     # Timestamps
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=True)
     created_by = Column(String(255), nullable=True)  # User who created the draft
-    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)  # Listing keyset column
     updated_by = Column(String(255), nullable=True)
     
+    # Read server defaults and onupdate values back with INSERT/UPDATE ... RETURNING;
+    # ORM flushes also check and bump version
+    __mapper_args__ = {"eager_defaults": True, "version_id_col": version}
+    
     # Add check constraints
     __table_args__ = (
         CheckConstraint("project_stage IN ('planning', 'initiated', 'in_progress')", name="check_draft_project_stage"),
         CheckConstraint("visibility IN ('private', 'public')", name="check_draft_visibility"),
         CheckConstraint("completion_percentage >= 0 AND completion_percentage <= 100", name="check_completion_percentage"),
+        # Draft listings order by (updated_at, id) desc, usually per user
+        Index("idx_perdix_mp_project_drafts_created_by_updated_at", "created_by", updated_at.desc(), id.desc()),
+        Index("idx_perdix_mp_project_drafts_updated_at_id", "updated_at", "id"),
+        # Completion-ordered / min_completion listings per user
+        Index(
+            "idx_perdix_mp_project_drafts_created_by_completion",
+            "created_by", completion_percentage.desc(), id.desc()
+        ),
     )
 
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, BigInteger
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from app.core.database import Base
+
+
+class ProjectReferenceCounter(Base):
+    """Last issued project reference sequence number per calendar year"""
+    __tablename__ = "perdix_mp_project_reference_counters"
+    
+    year = Column(Integer, primary_key=True, autoincrement=False)
+    last_value = Column(BigInteger, nullable=False, default=0)
+    
+    # Timestamps
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True)
@@ -120,7 +120,53 @@ class ProjectListResponse(BaseModel):
     status: str
     message: str
     data: list[ProjectResponse]
-    total: int
+    total: Optional[int] = None  # None when total=none was requested
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the following page
+    prev_cursor: Optional[str] = None  # Pass as cursor to fetch the preceding page
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSearchHighlights(BaseModel):
+    """HTML-escaped text with matched terms wrapped in <mark>...</mark>"""
+    title: str
+    description: Optional[str] = None  # Best matching fragments
+
+
+class ProjectSearchResult(ProjectResponse):
+    rank: float  # Higher is more relevant
+    highlights: ProjectSearchHighlights
+
+
+class ProjectSearchResponse(BaseModel):
+    status: str
+    message: str
+    data: list[ProjectSearchResult]
+    total: Optional[int] = None  # None when total=none was requested
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the following page
+    prev_cursor: Optional[str] = None  # Pass as cursor to fetch the preceding page
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProjectSummaryResponse(BaseModel):
+    """Columns shown on project list pages (fields=summary)"""
+    id: int
+    project_reference_id: str
+    title: str
+    organization_type: str
+    organization_id: str
+    category: Optional[str] = None
+    project_stage: Optional[str] = None
+    status: Optional[str] = None
+    visibility: Optional[str] = None
+    state: Optional[str] = None
+    city: Optional[str] = None
+    funding_requirement: Decimal
+    funding_raised: Optional[Decimal] = None
+    funding_percentage: Optional[Decimal] = None
+    currency: Optional[str] = None
+    created_at: Optional[datetime] = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional
+from typing import List, Optional
 from decimal import Decimal
 from datetime import date, datetime
 
@@ -72,6 +72,16 @@ class ProjectDraftUpdate(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class ProjectDraftAutosave(ProjectDraftUpdate):
+    """Schema for autosaving a draft - only the changed fields, plus the version they were made on"""
+    version: int = Field(..., ge=1, description="Draft version the changes are based on")
+
+
+class ProjectDraftBatchSubmit(BaseModel):
+    """Schema for submitting several drafts at once"""
+    draft_ids: List[int] = Field(..., min_length=1, max_length=100, description="IDs of the drafts to submit")
+
+
 class ProjectDraftResponse(BaseModel):
     """Schema for project draft response"""
     id: int
@@ -104,6 +114,7 @@ class ProjectDraftResponse(BaseModel):
     admin_notes: Optional[str] = None
     last_saved_tab: Optional[str] = None
     completion_percentage: Optional[Decimal] = None
+    version: Optional[int] = None  # Send back with autosaves (optimistic concurrency)
     created_at: Optional[datetime] = None
     created_by: Optional[str] = None
     updated_at: Optional[datetime] = None
@@ -117,5 +128,7 @@ class ProjectDraftListResponse(BaseModel):
     status: str
     message: str
     data: list[ProjectDraftResponse]
-    total: int
+    total: Optional[int] = None  # None when total=none was requested
+    next_cursor: Optional[str] = None  # Pass as cursor to fetch the following page
+    prev_cursor: Optional[str] = None  # Pass as cursor to fetch the preceding page
 
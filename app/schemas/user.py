@@ -0,0 +1,22 @@
+from pydantic import BaseModel, EmailStr, Field
+from typing import Optional
+
+
+class UserRegister(BaseModel):
+    full_name: str = Field(..., alias="fullName")
+    login: str
+    password: str
+    confirm_password: str = Field(..., alias="confirmPassword")
+    email: EmailStr
+    mobile_number: str = Field(..., alias="mobileNumber")
+    user_roles: Optional[list] = Field(None, alias="userRoles")
+
+    class Config:
+        populate_by_name = True
+
+
+class BulkUserRegister(BaseModel):
+    users: list[UserRegister] = Field(..., min_length=1, max_length=1000)
+
+    class Config:
+        populate_by_name = True
@@ -1,9 +1,9 @@
-import httpx
 from fastapi import HTTPException, status
 from app.core.config import settings
+from app.core.perdix_client import PerdixClient
 
 
-def obtain_jwt_from_perdix(login_data: dict, skip_relogin: str = "yes") -> tuple:
+async def obtain_jwt_from_perdix(client: PerdixClient, login_data: dict, skip_relogin: str = "yes") -> tuple:
     base = settings.PERDIX_ORIGIN.rstrip("/")
     url = f"{base}/gateway/jwt/token"
     headers = {
@@ -13,19 +13,10 @@ def obtain_jwt_from_perdix(login_data: dict, skip_relogin: str = "yes") -> tuple
         "referer": f"{settings.PERDIX_ORIGIN}/perdix-client/",
     }
     payload = {"loginData": login_data, "skip_relogin": skip_relogin}
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, headers=headers, json=payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
+    return await client.post(url, headers=headers, json=payload)
 
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
 
-
-def change_password_with_otp(otp: str, user_id: str, new_password: str, confirm_password: str) -> tuple:
+async def change_password_with_otp(client: PerdixClient, otp: str, user_id: str, new_password: str, confirm_password: str) -> tuple:
     """Change password using OTP verification via Perdix.
 
     Returns (body, status_code, is_json)
@@ -52,19 +43,10 @@ def change_password_with_otp(otp: str, user_id: str, new_password: str, confirm_
         "confirmPassword": confirm_password,
     }
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, headers=headers, json=payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.post(url, headers=headers, json=payload)
 
 
-def request_password_otp_from_perdix(user_id: str) -> tuple:
+async def request_password_otp_from_perdix(client: PerdixClient, user_id: str) -> tuple:
     """Request OTP for password change/forgot password via Perdix.
 
     Returns a tuple: (body, status_code, is_json)
@@ -86,19 +68,10 @@ def request_password_otp_from_perdix(user_id: str) -> tuple:
 
     params = {"userId": user_id}
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers, params=params)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, params=params)
 
 
-def validate_user_with_perdix(access_token: str, _unused=None) -> tuple:
+async def validate_user_with_perdix(client: PerdixClient, access_token: str, _unused=None) -> tuple:
     # Placeholder: implement with the actual Perdix validation endpoint used by your frontend
     base = settings.PERDIX_ORIGIN.rstrip("/")
     url = f"{base}/perdix-server/api/users/current"  # adjust to real endpoint if different
@@ -108,16 +81,7 @@ def validate_user_with_perdix(access_token: str, _unused=None) -> tuple:
         "origin": settings.PERDIX_ORIGIN,
         "referer": f"{settings.PERDIX_ORIGIN}/perdix-client/",
     }
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, dedupe=True)
 
 
 def get_redirect_url(branch_name: str) -> dict:
@@ -0,0 +1,81 @@
+"""
+Draft completion scoring, driven by one field-weight table
+"""
+from decimal import Decimal
+from typing import Any, NamedTuple, Tuple
+
+from sqlalchemy import Numeric, case, cast, func
+
+
+class CompletionField(NamedTuple):
+    name: str
+    weight: int = 1
+
+
+# Fields that count towards completion_percentage. Bit i of a draft's
+# filled_fields is COMPLETION_FIELDS[i], so only append to this table (the
+# c3e5a7b9d124 migration backfilled the mask in this order). Changing a
+# weight needs a data migration recomputing completion_percentage with
+# completion_sql(filled_fields).
+COMPLETION_FIELDS = (
+    CompletionField("organization_type"),
+    CompletionField("organization_id"),
+    CompletionField("title"),
+    CompletionField("contact_person"),
+    CompletionField("contact_person_designation"),
+    CompletionField("contact_person_email"),
+    CompletionField("contact_person_phone"),
+    CompletionField("department"),
+    CompletionField("category"),
+    CompletionField("description"),
+    CompletionField("start_date"),
+    CompletionField("end_date"),
+    CompletionField("state"),
+    CompletionField("city"),
+    CompletionField("ward"),
+    CompletionField("total_project_cost"),
+    CompletionField("funding_requirement"),
+    CompletionField("already_secured_funds"),
+    CompletionField("fundraising_start_date"),
+    CompletionField("fundraising_end_date"),
+    CompletionField("municipality_credit_rating"),
+    CompletionField("municipality_credit_score"),
+    CompletionField("project_stage"),
+    CompletionField("visibility"),
+)
+
+COMPLETION_BITS = {field.name: 1 << position for position, field in enumerate(COMPLETION_FIELDS)}
+ALL_COMPLETION_BITS = (1 << len(COMPLETION_FIELDS)) - 1
+TOTAL_COMPLETION_WEIGHT = sum(field.weight for field in COMPLETION_FIELDS)
+
+
+def filled_field_mask(draft: Any) -> int:
+    """Bitmask of the completion fields that have a value on draft"""
+    return sum(COMPLETION_BITS[field.name] for field in COMPLETION_FIELDS if getattr(draft, field.name))
+
+
+def changed_field_bits(changes: dict) -> Tuple[int, int]:
+    """(bits to clear, bits to set) in filled_fields for a partial update"""
+    cleared = filled = 0
+    for name, value in changes.items():
+        bit = COMPLETION_BITS.get(name)
+        if bit:
+            cleared |= bit
+            if value:
+                filled |= bit
+    return cleared, filled
+
+
+def completion_from_mask(mask: int) -> Decimal:
+    """Weighted completion percentage (0-100, 2 decimals) for a filled_fields mask"""
+    score = sum(field.weight for field in COMPLETION_FIELDS if mask & COMPLETION_BITS[field.name])
+    return Decimal(str(round(score / TOTAL_COMPLETION_WEIGHT * 100, 2)))
+
+
+def completion_sql(mask):
+    """SQL equivalent of completion_from_mask for a filled_fields expression"""
+    score = sum(
+        case((mask.bitwise_and(COMPLETION_BITS[field.name]) != 0, field.weight), else_=0)
+        for field in COMPLETION_FIELDS
+    )
+    return func.round(cast(score, Numeric) * 100 / TOTAL_COMPLETION_WEIGHT, 2)
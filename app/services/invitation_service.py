@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.invitation import Invitation
 from app.schemas.invitation import InvitationCreate
+from app.services.organization_service import validate_organization_id
 from app.core.config import settings
 
 
@@ -27,6 +28,9 @@ def generate_invitation_token(db: Session, length_bytes: int = 9, max_attempts:
 def create_invitation(payload: InvitationCreate, db: Session) -> dict:
     """Create a new invitation and return invitation details"""
     
+    # Resolved from the in-process organization directory (no Perdix call)
+    validate_organization_id(payload.organization_id)
+    
     # Check if invitation already exists for this email
     existing_invitation = db.query(Invitation).filter(Invitation.email == payload.email).first()
     if existing_invitation and not existing_invitation.is_used:
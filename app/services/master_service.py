@@ -1,30 +1,126 @@
-import httpx
-from sqlalchemy.orm import Session
+import hashlib
+from typing import NamedTuple
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, object_session
 from fastapi import HTTPException, status
+from app.core.cache import AsyncTTLCache
 from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.core.perdix_client import PerdixClient
 from app.models.project_category_master import ProjectCategoryMaster
 from app.models.project_stage_master import ProjectStageMaster
-from app.schemas.master import ProjectCategoryMasterResponse, ProjectStageMasterResponse
+from app.schemas.master import ProjectCategoryMasterResponse, ProjectStageMasterResponse, MasterListResponse
+from app.services.user_role_service import role_catalog_cache
+
+logger = get_logger("services.master")
 
 
 class MasterService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def get_all_project_categories(self):
+    async def get_all_project_categories(self):
         """Get all project categories from master table"""
-        categories = self.db.query(ProjectCategoryMaster).order_by(ProjectCategoryMaster.id).all()
+        categories = (await self.db.scalars(select(ProjectCategoryMaster).order_by(ProjectCategoryMaster.id))).all()
         # Convert SQLAlchemy models to Pydantic schemas
         return [ProjectCategoryMasterResponse.model_validate(category) for category in categories]
     
-    def get_all_project_stages(self):
+    async def get_all_project_stages(self):
         """Get all project stages from master table"""
-        stages = self.db.query(ProjectStageMaster).order_by(ProjectStageMaster.id).all()
+        stages = (await self.db.scalars(select(ProjectStageMaster).order_by(ProjectStageMaster.id))).all()
         # Convert SQLAlchemy models to Pydantic schemas
         return [ProjectStageMasterResponse.model_validate(stage) for stage in stages]
 
 
-def fetch_roles_from_perdix() -> tuple:
+class MasterSnapshot(NamedTuple):
+    """A master list ready to serve: serialized response body plus its ETag"""
+    body: bytes
+    etag: str
+    count: int
+    values: frozenset  # Allowed `value`s, used by validation_service
+
+
+# Master tables almost never change: keep the serialized responses in memory,
+# refreshed in the background after MASTER_CACHE_TTL and on invalidation
+master_data_cache = AsyncTTLCache(
+    "master_data",
+    ttl=settings.MASTER_CACHE_TTL,
+    stale_ttl=settings.MASTER_CACHE_STALE_TTL,
+)
+
+MASTER_LISTS = {
+    "project_categories": (MasterService.get_all_project_categories, "Project categories fetched successfully"),
+    "project_stages": (MasterService.get_all_project_stages, "Project stages fetched successfully"),
+}
+
+
+async def get_master_snapshot(name: str) -> MasterSnapshot:
+    """Serialized master list; hits the database only on first use or refresh"""
+    return await master_data_cache.get_or_load(name, lambda: _load_master_snapshot(name))
+
+
+async def warm_master_data() -> None:
+    """Load every master list (called at startup so requests never wait)"""
+    for name in MASTER_LISTS:
+        try:
+            await master_data_cache.refresh(name, lambda name=name: _load_master_snapshot(name))
+        except Exception as e:
+            logger.warning(f"Could not warm master data '{name}': {str(e)}")
+
+
+def invalidate_master_data(name: str = None) -> None:
+    """Drop one master list (or all); the next request reloads it"""
+    master_data_cache.invalidate(name)
+
+
+async def _load_master_snapshot(name: str) -> MasterSnapshot:
+    loader, message = MASTER_LISTS[name]
+    async with AsyncSessionLocal(info={"replica_reads": True}) as db:
+        items = await loader(MasterService(db))
+    body = MasterListResponse(status="success", message=message, data=items).model_dump_json().encode()
+    # Content hash, so every worker hands out the same ETag for the same data
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    logger.info(f"Master data '{name}' loaded: {len(items)} rows, ETag {etag}")
+    return MasterSnapshot(body, etag, len(items), frozenset(item.value for item in items))
+
+
+# Writes through the ORM in this process drop the cached list once they are
+# committed (a reload during the flush would cache uncommitted rows, and a
+# rolled-back write changes nothing); other workers pick the change up
+# within MASTER_CACHE_TTL
+CHANGED_MASTER_LISTS = "changed_master_lists"
+
+
+def _record_master_change(name: str, target) -> None:
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(CHANGED_MASTER_LISTS, set()).add(name)
+
+
+for _model, _name in ((ProjectCategoryMaster, "project_categories"), (ProjectStageMaster, "project_stages")):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, lambda mapper, connection, target, name=_name: _record_master_change(name, target))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_master_lists(session) -> None:
+    for name in session.info.pop(CHANGED_MASTER_LISTS, ()):
+        invalidate_master_data(name)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_master_lists(session) -> None:
+    session.info.pop(CHANGED_MASTER_LISTS, None)
+
+
+async def fetch_roles_from_perdix(client: PerdixClient) -> tuple:
+    """Get all roles from Perdix (cached, invalidated on role create/update)"""
+    return await role_catalog_cache.get_or_load("master_roles", lambda: _fetch_roles_from_perdix(client))
+
+
+async def _fetch_roles_from_perdix(client: PerdixClient) -> tuple:
     base = settings.PERDIX_ORIGIN.rstrip("/")
     path = "/management/user-management/allRoles.php"
     url = f"{base}{path}"
@@ -39,18 +135,6 @@ def fetch_roles_from_perdix() -> tuple:
         "sec-fetch-mode": "cors",
         "sec-fetch-site": "same-origin",
     }
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers)
-            # Debug: log the response for troubleshooting
-            print(f"Perdix API Response Status: {response.status_code}")
-            print(f"Perdix API Response Headers: {dict(response.headers)}")
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, dedupe=True)
 
 
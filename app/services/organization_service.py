@@ -1,10 +1,126 @@
-import httpx
+import asyncio
+from typing import Dict, Optional, Union
 from fastapi import HTTPException, status
+from app.core.cache import AsyncTTLCache, is_success_response
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.perdix_client import PerdixClient
 from app.schemas.organization import OrganizationCreate, OrganizationUpdate
 
+logger = get_logger("services.organization")
 
-def create_organization_in_perdix(payload: OrganizationCreate) -> tuple:
+
+class OrganizationDirectory:
+    """In-memory index of Perdix branches by id and branch name.
+
+    Rebuilt from the cached /api/branch list and patched in place on
+    create/update, so other services can resolve organizations in O(1)
+    without a network call.
+    """
+
+    def __init__(self):
+        self._by_id: Dict[str, dict] = {}
+        self._by_name: Dict[str, dict] = {}
+
+    @staticmethod
+    def _name_key(branch_name: str) -> str:
+        return str(branch_name).strip().casefold()
+
+    @property
+    def is_loaded(self) -> bool:
+        return bool(self._by_id)
+
+    def replace_all(self, branches: list) -> None:
+        """Rebuild both indexes from a full branch list"""
+        by_id: Dict[str, dict] = {}
+        by_name: Dict[str, dict] = {}
+        for branch in branches:
+            if not isinstance(branch, dict) or branch.get("id") is None:
+                continue
+            by_id[str(branch["id"])] = branch
+            if branch.get("branchName"):
+                by_name[self._name_key(branch["branchName"])] = branch
+        # Swap whole dicts so readers never see a half-built index
+        self._by_id, self._by_name = by_id, by_name
+
+    def upsert(self, branch: dict) -> None:
+        """Add or replace a single branch (incremental refresh after writes)"""
+        if not isinstance(branch, dict) or branch.get("id") is None:
+            return
+        previous = self._by_id.get(str(branch["id"]))
+        if previous and previous.get("branchName"):
+            self._by_name.pop(self._name_key(previous["branchName"]), None)
+        self._by_id[str(branch["id"])] = branch
+        if branch.get("branchName"):
+            self._by_name[self._name_key(branch["branchName"])] = branch
+
+    def get_by_id(self, organization_id: Union[int, str]) -> Optional[dict]:
+        return self._by_id.get(str(organization_id))
+
+    def get_by_name(self, branch_name: str) -> Optional[dict]:
+        return self._by_name.get(self._name_key(branch_name))
+
+
+organization_directory = OrganizationDirectory()
+
+
+def _rebuild_directory(key: str, result: tuple) -> None:
+    """Follow the branch list the cache just stored (loads dropped by invalidate never get here)"""
+    body, status_code, is_json = result
+    if isinstance(body, list):
+        organization_directory.replace_all(body)
+
+
+organization_cache = AsyncTTLCache(
+    "perdix_branches",
+    ttl=settings.PERDIX_ORG_CACHE_TTL,
+    stale_ttl=settings.PERDIX_ORG_CACHE_STALE_TTL,
+    cacheable=is_success_response,
+    on_store=_rebuild_directory,
+)
+
+
+def get_organization_by_id(organization_id: Union[int, str]) -> Optional[dict]:
+    """O(1) lookup of a Perdix branch by id from the in-process directory"""
+    return organization_directory.get_by_id(organization_id)
+
+
+def check_organization_id(organization_id: Union[int, str]) -> Optional[str]:
+    """Error message if organization_id is unknown to the directory (opt-in).
+
+    Only with PERDIX_ORG_VALIDATE_IDS enabled: the directory is per worker
+    and refreshed periodically, so a branch created in Perdix meanwhile
+    would be rejected. Until the first branch list has loaded (cold start,
+    Perdix unreachable) every id is accepted.
+    """
+    if not settings.PERDIX_ORG_VALIDATE_IDS:
+        return None
+    if organization_directory.is_loaded and get_organization_by_id(organization_id) is None:
+        return f"Unknown organization_id: {organization_id}"
+    return None
+
+
+def validate_organization_id(organization_id: Union[int, str]) -> None:
+    """Raise 422 for an organization_id check_organization_id rejects"""
+    error = check_organization_id(organization_id)
+    if error:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=error
+        )
+
+
+def _apply_organization_write(result: tuple) -> tuple:
+    """Patch the directory with a successful create/update response"""
+    body, status_code, is_json = result
+    if status_code in (200, 201):
+        organization_cache.invalidate()
+        if is_json:
+            organization_directory.upsert(body)
+    return result
+
+
+async def create_organization_in_perdix(client: PerdixClient, payload: OrganizationCreate) -> tuple:
     """Create a new organization (branch) in Perdix system"""
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/branch"
@@ -37,19 +153,10 @@ def create_organization_in_perdix(payload: OrganizationCreate) -> tuple:
         "fingerPrintDeviceType": payload.finger_print_device_type
     }
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, headers=headers, json=organization_payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return _apply_organization_write(await client.post(url, headers=headers, json=organization_payload))
 
 
-def update_organization_in_perdix(organization_id: int, payload: OrganizationUpdate) -> tuple:
+async def update_organization_in_perdix(client: PerdixClient, organization_id: int, payload: OrganizationUpdate) -> tuple:
     """Update an existing organization (branch) in Perdix system"""
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/branch"
@@ -95,19 +202,10 @@ def update_organization_in_perdix(organization_id: int, payload: OrganizationUpd
     # Set version default to 0 if not provided from frontend
     organization_payload["version"] = 2
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.put(url, headers=headers, json=organization_payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return _apply_organization_write(await client.put(url, headers=headers, json=organization_payload))
 
 
-def update_organization_in_perdix_raw(payload: dict) -> tuple:
+async def update_organization_in_perdix_raw(client: PerdixClient, payload: dict) -> tuple:
     """Update organization (branch) in Perdix using the exact frontend payload (no server-side mutation)."""
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/branch"
@@ -129,20 +227,26 @@ def update_organization_in_perdix_raw(payload: dict) -> tuple:
         "sec-fetch-site": "same-origin",
     }
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.put(url, headers=headers, json=payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
+    return _apply_organization_write(await client.put(url, headers=headers, json=payload))
 
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
 
+async def get_organizations_from_perdix(client: PerdixClient) -> tuple:
+    """Get all organizations (branches) from Perdix system (cached)"""
+    return await organization_cache.get_or_load("branches", lambda: _fetch_organizations_from_perdix(client))
 
-def get_organizations_from_perdix() -> tuple:
-    """Get all organizations (branches) from Perdix system"""
+
+async def refresh_organization_directory(client: PerdixClient, interval: float) -> None:
+    """Keep the organization directory warm; runs for the app lifetime"""
+    while True:
+        try:
+            await organization_cache.refresh("branches", lambda: _fetch_organizations_from_perdix(client))
+            logger.debug("Organization directory refreshed")
+        except Exception as exc:
+            logger.warning(f"Organization directory refresh failed: {str(exc)}")
+        await asyncio.sleep(interval)
+
+
+async def _fetch_organizations_from_perdix(client: PerdixClient) -> tuple:
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/branch"
     
@@ -161,13 +265,4 @@ def get_organizations_from_perdix() -> tuple:
         "sec-fetch-site": "same-origin",
     }
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, dedupe=True)
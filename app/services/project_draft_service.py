@@ -1,111 +1,97 @@
-from typing import Tuple
-from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from sqlalchemy.orm.exc import StaleDataError
 from fastapi import HTTPException, status
 from decimal import Decimal
-from datetime import datetime
 from pydantic import ValidationError
+from app.models.project import Project
 from app.models.project_draft import ProjectDraft
-from app.schemas.project_draft import ProjectDraftCreate, ProjectDraftUpdate
+from app.schemas.project_draft import ProjectDraftCreate, ProjectDraftUpdate, ProjectDraftAutosave, ProjectDraftResponse
+from app.core.coalescing import WriteCoalescer
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
 from app.core.logging import get_logger
-from app.services.project_service import ProjectService
+from app.core.pagination import CountCache, Page, keyset_paginate, resolve_total
+from app.services.draft_completion import (
+    ALL_COMPLETION_BITS,
+    changed_field_bits,
+    completion_from_mask,
+    completion_sql,
+    filled_field_mask,
+)
+from app.services.organization_service import check_organization_id
+from app.services.project_reference_allocator import ProjectReferenceAllocator
+from app.services.project_service import ProjectService, project_count_cache
+from app.services.validation_service import check_choices, load_choice_sets, validate_choices
 logger = get_logger("services.project_draft")
 
+# Drafts have no status of their own
+DRAFT_CHOICE_FIELDS = ("project_stage", "visibility", "category")
 
-class ProjectDraftService:
-    def __init__(self, db: Session):
-        self.db = db
+# Exact listing totals, reused per worker for a few seconds
+draft_count_cache = CountCache("project_drafts", settings.LIST_TOTAL_CACHE_TTL, settings.LIST_TOTAL_CACHE_MAX_ENTRIES)
+
+# Orderings offered by the draft listing (each backed by a per-user index)
+DRAFT_SORT_COLUMNS = {
+    "updated_at": ProjectDraft.updated_at,
+    "completion": ProjectDraft.completion_percentage,
+}
+
+# Response columns, in ProjectDraftResponse order (for serializing rows directly)
+DRAFT_RESPONSE_FIELDS = tuple(ProjectDraftResponse.model_fields)
+
+# Autosaves to a draft version that arrive while one is being written are written once, after it
+draft_autosave_coalescer = WriteCoalescer("draft_autosave", settings.DRAFT_AUTOSAVE_COALESCE)
+
+
+async def autosave_draft(draft_id: int, autosave: ProjectDraftAutosave, user_id: str = None) -> dict:
+    """Validate an autosave and write it, merged with others for the same draft version.
+
+    Saves queued behind an in-flight save of the same version apply on top
+    of the version it wrote. Each write runs in its own session since it
+    may serve several requests.
+    Returns the draft's id, new version, completion_percentage and updated_at.
+    """
+    changes = autosave.model_dump(exclude_unset=True, exclude={"version"})
     
-    def _calculate_completion_percentage(self, draft: ProjectDraft) -> Decimal:
-        """Calculate completion percentage based on filled fields"""
-        total_fields = 24  # Total number of main fields (updated to include 3 contact + 3 location fields)
-        filled_fields = 0
-        
-        # Count filled fields
-        if draft.organization_type:
-            filled_fields += 1
-        if draft.organization_id:
-            filled_fields += 1
-        if draft.title:
-            filled_fields += 1
-        if draft.contact_person:
-            filled_fields += 1
-        if draft.contact_person_designation:
-            filled_fields += 1
-        if draft.contact_person_email:
-            filled_fields += 1
-        if draft.contact_person_phone:
-            filled_fields += 1
-        if draft.department:
-            filled_fields += 1
-        if draft.category:
-            filled_fields += 1
-        if draft.description:
-            filled_fields += 1
-        if draft.start_date:
-            filled_fields += 1
-        if draft.end_date:
-            filled_fields += 1
-        if draft.state:
-            filled_fields += 1
-        if draft.city:
-            filled_fields += 1
-        if draft.ward:
-            filled_fields += 1
-        if draft.total_project_cost:
-            filled_fields += 1
-        if draft.funding_requirement:
-            filled_fields += 1
-        if draft.already_secured_funds:
-            filled_fields += 1
-        if draft.fundraising_start_date:
-            filled_fields += 1
-        if draft.fundraising_end_date:
-            filled_fields += 1
-        if draft.municipality_credit_rating:
-            filled_fields += 1
-        if draft.municipality_credit_score:
-            filled_fields += 1
-        if draft.project_stage:
-            filled_fields += 1
-        if draft.visibility:
-            filled_fields += 1
-        
-        percentage = (filled_fields / total_fields) * 100
-        return Decimal(str(round(percentage, 2)))
+    # Currency is backend-controlled - remove if frontend tries to change it
+    if 'currency' in changes:
+        logger.warning(f"Attempted to update currency for draft {draft_id}. Currency is backend-controlled and will be ignored.")
+        del changes['currency']
     
-    def _validate_project_stage(self, stage: str):
-        """Validate project stage"""
-        valid_stages = ['planning', 'initiated', 'in_progress']
-        if stage and stage not in valid_stages:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid project stage. Must be one of: {', '.join(valid_stages)}"
-            )
+    # Validated per request, so one bad autosave cannot fail a merged write
+    await validate_choices(changes, DRAFT_CHOICE_FIELDS)
     
-    def _validate_visibility(self, visibility: str):
-        """Validate project visibility"""
-        valid_visibilities = ['private', 'public']
-        if visibility and visibility not in valid_visibilities:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid visibility. Must be one of: {', '.join(valid_visibilities)}"
-            )
+    async def write(merged: dict, previous: Optional[dict]) -> dict:
+        version = previous["version"] if previous else autosave.version
+        async with AsyncSessionLocal() as db:
+            return await ProjectDraftService(db).apply_autosave(draft_id, version, merged, user_id)
     
-    def create_draft(self, draft_data: ProjectDraftCreate, user_id: str = None) -> ProjectDraft:
+    return await draft_autosave_coalescer.submit((draft_id, autosave.version, user_id), changes, write)
+
+
+class ProjectDraftService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    def _update_completion(self, draft: ProjectDraft) -> None:
+        """Recompute filled_fields and completion_percentage from the draft's values"""
+        draft.filled_fields = filled_field_mask(draft)
+        draft.completion_percentage = completion_from_mask(draft.filled_fields)
+    
+    async def create_draft(self, draft_data: ProjectDraftCreate, user_id: str = None) -> ProjectDraft:
         """Create a new project draft"""
         logger.info(f"Creating project draft")
         
         try:
-            # Validate stage and visibility if provided
-            if draft_data.project_stage:
-                self._validate_project_stage(draft_data.project_stage)
-            if draft_data.visibility:
-                self._validate_visibility(draft_data.visibility)
-            
             # Create draft dict
             draft_dict = draft_data.model_dump(exclude_unset=True)
             
+            # Validate stage, visibility and category if provided
+            await validate_choices(draft_dict, DRAFT_CHOICE_FIELDS)
+            
             # Set defaults
             if 'already_secured_funds' not in draft_dict or draft_dict['already_secured_funds'] is None:
                 draft_dict['already_secured_funds'] = Decimal('0')
@@ -121,25 +107,22 @@ class ProjectDraftService:
                 draft_dict['created_by'] = user_id
                 draft_dict['updated_by'] = user_id
             
-            # Create draft
+            # Create draft (completion computed up front so it is part of the INSERT)
             draft = ProjectDraft(**draft_dict)
+            self._update_completion(draft)
             self.db.add(draft)
-            self.db.flush()  # Flush to get ID
-            
-            # Calculate completion percentage
-            draft.completion_percentage = self._calculate_completion_percentage(draft)
-            
-            self.db.commit()
-            self.db.refresh(draft)
+            # INSERT ... RETURNING fills id and timestamps
+            await self.db.commit()
+            draft_count_cache.invalidate()
             
             logger.info(f"Project draft {draft.id} created successfully")
             return draft
             
         except HTTPException:
-            self.db.rollback()
+            await self.db.rollback()
             raise
         except IntegrityError as e:
-            self.db.rollback()
+            await self.db.rollback()
             error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
             logger.error(f"Database integrity error creating draft: {error_msg}")
             raise HTTPException(
@@ -147,7 +130,7 @@ class ProjectDraftService:
                 detail=f"Database constraint violation: {error_msg}"
             )
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
             logger.error(f"Database error creating draft: {error_msg}")
             raise HTTPException(
@@ -155,22 +138,22 @@ class ProjectDraftService:
                 detail="Database error occurred. Please try again later."
             )
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error creating project draft: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create project draft: {str(e)}"
             )
     
-    def get_draft_by_id(self, draft_id: int, user_id: str = None) -> ProjectDraft:
+    async def get_draft_by_id(self, draft_id: int, user_id: str = None) -> ProjectDraft:
         """Get draft by ID"""
-        query = self.db.query(ProjectDraft).filter(ProjectDraft.id == draft_id)
+        query = select(ProjectDraft).where(ProjectDraft.id == draft_id)
         
         # If user_id provided, ensure user owns the draft
         if user_id:
-            query = query.filter(ProjectDraft.created_by == user_id)
+            query = query.where(ProjectDraft.created_by == user_id)
         
-        draft = query.first()
+        draft = await self.db.scalar(query)
         if not draft:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -178,71 +161,94 @@ class ProjectDraftService:
             )
         return draft
     
-    def get_drafts(
+    async def get_drafts(
         self,
         user_id: str = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> Tuple[list[ProjectDraft], int]:
-        """Get list of drafts for a user"""
-        query = self.db.query(ProjectDraft)
+        limit: int = 100,
+        cursor: str = None,
+        total_mode: str = "exact",
+        min_completion: Optional[float] = None,
+        order_by: str = "updated_at"
+    ) -> Page:
+        """Get a page of drafts for a user, most recently updated (or most complete) first"""
+        query = select(ProjectDraft)
         
         # Filter by user if provided
         if user_id:
-            query = query.filter(ProjectDraft.created_by == user_id)
+            query = query.where(ProjectDraft.created_by == user_id)
+        
+        # completion_percentage is kept in step with filled_fields on every write
+        if min_completion is not None:
+            query = query.where(ProjectDraft.completion_percentage >= min_completion)
         
         # Get total count
-        total = query.count()
+        total = await resolve_total(self.db, query, total_mode, draft_count_cache, (user_id, min_completion))
         
         # Apply pagination
-        drafts = query.order_by(ProjectDraft.updated_at.desc()).offset(skip).limit(limit).all()
+        sort_column = DRAFT_SORT_COLUMNS[order_by]
+        drafts, next_cursor, prev_cursor = await keyset_paginate(
+            self.db, query, sort_column, ProjectDraft.id, limit, cursor=cursor, skip=skip
+        )
         
-        return drafts, total
+        return Page(drafts, total, next_cursor, prev_cursor)
     
-    def update_draft(self, draft_id: int, draft_data: ProjectDraftUpdate, user_id: str = None) -> ProjectDraft:
+    async def _apply_update(self, draft_id: int, draft_data: ProjectDraftUpdate, user_id: str = None) -> ProjectDraft:
+        """Validate draft_data and write it with one UPDATE ... RETURNING (not committed)"""
+        # Get update data
+        update_dict = draft_data.model_dump(exclude_unset=True)
+        
+        # Currency is backend-controlled - remove if frontend tries to change it
+        if 'currency' in update_dict:
+            logger.warning(f"Attempted to update currency for draft {draft_id}. Currency is backend-controlled and will be ignored.")
+            del update_dict['currency']
+        
+        # Validate stage, visibility and category if provided
+        await validate_choices(update_dict, DRAFT_CHOICE_FIELDS)
+        
+        # filled_fields is patched for just the changed fields, as in apply_autosave
+        cleared, filled = changed_field_bits(update_dict)
+        filled_fields = ProjectDraft.filled_fields.bitwise_and(ALL_COMPLETION_BITS & ~cleared).bitwise_or(filled)
+        values = {
+            **update_dict,
+            "filled_fields": filled_fields,
+            "completion_percentage": completion_sql(filled_fields),
+            "version": ProjectDraft.version + 1,
+            "updated_at": func.now(),
+        }
+        # Update user tracking
+        if user_id:
+            values["updated_by"] = user_id
+        
+        query = update(ProjectDraft).where(ProjectDraft.id == draft_id)
+        if user_id:
+            query = query.where(ProjectDraft.created_by == user_id)
+        
+        # One UPDATE ... RETURNING both applies the change and reads back the row
+        draft = await self.db.scalar(query.values(**values).returning(ProjectDraft))
+        if not draft:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Project draft with ID {draft_id} not found"
+            )
+        return draft
+    
+    async def update_draft(self, draft_id: int, draft_data: ProjectDraftUpdate, user_id: str = None) -> ProjectDraft:
         """Update an existing draft"""
         logger.info(f"Updating project draft {draft_id}")
         
         try:
-            draft = self.get_draft_by_id(draft_id, user_id)
-            
-            # Get update data
-            update_dict = draft_data.model_dump(exclude_unset=True)
-            
-            # Currency is backend-controlled - remove if frontend tries to change it
-            if 'currency' in update_dict:
-                logger.warning(f"Attempted to update currency for draft {draft_id}. Currency is backend-controlled and will be ignored.")
-                del update_dict['currency']
-            
-            # Validate stage and visibility if provided
-            if 'project_stage' in update_dict:
-                self._validate_project_stage(update_dict['project_stage'])
-            if 'visibility' in update_dict:
-                self._validate_visibility(update_dict['visibility'])
-            
-            # Update fields
-            for field, value in update_dict.items():
-                setattr(draft, field, value)
-            
-            # Update user tracking
-            if user_id:
-                draft.updated_by = user_id
-            draft.updated_at = datetime.now()
-            
-            # Recalculate completion percentage
-            draft.completion_percentage = self._calculate_completion_percentage(draft)
-            
-            self.db.commit()
-            self.db.refresh(draft)
+            draft = await self._apply_update(draft_id, draft_data, user_id)
+            await self.db.commit()
             
             logger.info(f"Project draft {draft.id} updated successfully")
             return draft
             
         except HTTPException:
-            self.db.rollback()
+            await self.db.rollback()
             raise
         except IntegrityError as e:
-            self.db.rollback()
+            await self.db.rollback()
             error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
             logger.error(f"Database integrity error updating draft {draft_id}: {error_msg}")
             raise HTTPException(
@@ -250,7 +256,7 @@ class ProjectDraftService:
                 detail=f"Database constraint violation: {error_msg}"
             )
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
             logger.error(f"Database error updating draft {draft_id}: {error_msg}")
             raise HTTPException(
@@ -258,29 +264,96 @@ class ProjectDraftService:
                 detail="Database error occurred. Please try again later."
             )
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error updating project draft {draft_id}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to update project draft: {str(e)}"
             )
     
-    def delete_draft(self, draft_id: int, user_id: str = None) -> None:
+    async def apply_autosave(self, draft_id: int, version: int, changes: dict, user_id: str = None) -> dict:
+        """Apply autosaved changes with one UPDATE ... RETURNING, without reading the draft.
+
+        Only matches the draft while it is still at ``version``. filled_fields
+        is patched for just the changed fields and completion_percentage is
+        derived from it in the same statement.
+        """
+        cleared, filled = changed_field_bits(changes)
+        filled_fields = ProjectDraft.filled_fields.bitwise_and(ALL_COMPLETION_BITS & ~cleared).bitwise_or(filled)
+        values = {
+            **changes,
+            "filled_fields": filled_fields,
+            "completion_percentage": completion_sql(filled_fields),
+            "version": ProjectDraft.version + 1,
+            "updated_at": func.now(),
+        }
+        if user_id:
+            values["updated_by"] = user_id
+        
+        query = update(ProjectDraft).where(ProjectDraft.id == draft_id, ProjectDraft.version == version)
+        if user_id:
+            query = query.where(ProjectDraft.created_by == user_id)
+        query = query.values(**values).returning(
+            ProjectDraft.id, ProjectDraft.version, ProjectDraft.completion_percentage, ProjectDraft.updated_at
+        )
+        
+        try:
+            saved = (await self.db.execute(query, execution_options={"synchronize_session": False})).first()
+            if saved is None:
+                await self.db.rollback()
+                # Missing (404) or saved by someone else since the client loaded it
+                current = await self.get_draft_by_id(draft_id, user_id)
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Project draft {draft_id} is at version {current.version}, not {version}. Reload it and retry."
+                )
+            await self.db.commit()
+            return saved._asdict()
+            
+        except HTTPException:
+            await self.db.rollback()
+            raise
+        except IntegrityError as e:
+            await self.db.rollback()
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.error(f"Database integrity error autosaving draft {draft_id}: {error_msg}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Database constraint violation: {error_msg}"
+            )
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.error(f"Database error autosaving draft {draft_id}: {error_msg}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database error occurred. Please try again later."
+            )
+    
+    async def delete_draft(self, draft_id: int, user_id: str = None) -> None:
         """Delete a draft"""
         logger.info(f"Deleting project draft {draft_id}")
         
         try:
-            draft = self.get_draft_by_id(draft_id, user_id)
-            self.db.delete(draft)
-            self.db.commit()
+            draft = await self.get_draft_by_id(draft_id, user_id)
+            await self.db.delete(draft)
+            await self.db.commit()
+            draft_count_cache.invalidate()
             
             logger.info(f"Project draft {draft_id} deleted successfully")
             
         except HTTPException:
-            self.db.rollback()
+            await self.db.rollback()
             raise
+        except StaleDataError:
+            await self.db.rollback()
+            logger.warning(f"Project draft {draft_id} changed during delete")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Project draft {draft_id} was changed by another request. Reload it and retry."
+            )
         except SQLAlchemyError as e:
-            self.db.rollback()
+            await self.db.rollback()
             error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
             logger.error(f"Database error deleting draft {draft_id}: {error_msg}")
             raise HTTPException(
@@ -288,7 +361,7 @@ class ProjectDraftService:
                 detail="Database error occurred. Please try again later."
             )
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error deleting project draft {draft_id}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -404,100 +477,143 @@ class ProjectDraftService:
                 detail=f"Failed to convert draft to project: {str(e)}"
             )
     
-    def submit_draft(self, draft_id: int, user_id: str = None):
-        """Submit draft - converts to project and deletes draft
+    async def submit_draft(self, draft_id: int, user_id: str = None, draft_data: Optional[ProjectDraftUpdate] = None):
+        """Submit draft - converts to project and deletes draft in one transaction
         
-        This method handles the complete submission flow with proper error handling:
-        1. Validates draft exists and user has access
-        2. Converts draft to ProjectCreate schema
-        3. Creates project using ProjectService
-        4. Deletes draft only after successful project creation
+        draft_data, if given, is applied to the draft in the same transaction,
+        so a rejected submission leaves the draft as it was.
         
         Raises:
-            HTTPException: If any step fails
+            HTTPException: If the draft is missing, incomplete or invalid
+        """
+        logger.info(f"Submitting draft {draft_id} for user {user_id}")
+        updates = {draft_id: draft_data} if draft_data is not None else None
+        projects, errors = await self.submit_drafts([draft_id], user_id=user_id, updates=updates)
+        if errors:
+            raise HTTPException(status_code=errors[0]["status_code"], detail=errors[0]["error"])
+        return projects[0]["project"]
+    
+    async def submit_drafts(
+        self,
+        draft_ids: List[int],
+        user_id: str = None,
+        updates: Optional[Dict[int, ProjectDraftUpdate]] = None
+    ) -> Tuple[List[dict], List[dict]]:
+        """Submit several drafts as pending_validation projects in one transaction.
+        
+        1. ``updates`` (changes per draft id) are written first.
+        2. One SELECT ... FOR UPDATE loads and locks the drafts, which are
+           converted to ProjectCreate and validated (required fields, dates,
+           choices, organization_id), exactly as create_project would.
+        3. The projects are inserted from the validated values with one block
+           of reference IDs and a multi-row INSERT ... RETURNING, and the
+           drafts are deleted.
+        
+        All of it commits together, so a failure never leaves a project
+        without its draft deleted or the reverse. Missing or invalid drafts
+        are reported and left untouched (updates included).
+        
+        Returns (submitted, errors): ``{"draft_id", "project"}`` per created
+        project in draft_ids order, ``{"draft_id", "status_code", "error"}``
+        per rejected draft.
         """
-        draft = None
-        project = None
+        draft_ids = list(dict.fromkeys(draft_ids))
+        submitted, errors = [], []
         
         try:
-            # Step 1: Get and validate draft
-            draft = self.get_draft_by_id(draft_id, user_id=user_id)
-            logger.info(f"Submitting draft {draft_id} for user {user_id}")
-            
-            # Step 2: Convert draft to ProjectCreate schema
-            # This validates required fields and data types
-            project_data = self.convert_draft_to_project_create(draft)
-            
-            # Step 3: Create project using ProjectService
-            # Import here to avoid circular dependency
-           
-            project_service = ProjectService(self.db)
-            
-            try:
-                project = project_service.create_project(project_data)
-                logger.info(f"Project {project.id} created successfully from draft {draft_id}")
-            except HTTPException as e:
-                # Re-raise HTTPExceptions from project creation (validation errors, etc.)
-                logger.warning(f"Project creation failed for draft {draft_id}: {e.detail}")
-                raise
-            except IntegrityError as e:
-                # Handle database constraint violations
-                self.db.rollback()
-                error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
-                
-                # Check for specific constraint violations
-                if 'project_reference_id' in error_msg.lower() or 'unique' in error_msg.lower():
-                    logger.error(f"Duplicate project reference ID detected for draft {draft_id}")
-                    raise HTTPException(
-                        status_code=status.HTTP_409_CONFLICT,
-                        detail="A project with this reference ID already exists. Please try again."
-                    )
-                else:
-                    logger.error(f"Database integrity error creating project from draft {draft_id}: {error_msg}")
-                    raise HTTPException(
-                        status_code=status.HTTP_409_CONFLICT,
-                        detail=f"Database constraint violation: {error_msg}"
-                    )
-            except SQLAlchemyError as e:
-                # Handle other database errors
-                self.db.rollback()
-                error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
-                logger.error(f"Database error creating project from draft {draft_id}: {error_msg}")
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Database error occurred while creating project. Please try again later."
-                )
-            except Exception as e:
-                # Handle any other unexpected errors during project creation
-                self.db.rollback()
-                logger.error(f"Unexpected error creating project from draft {draft_id}: {str(e)}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    detail=f"Failed to create project: {str(e)}"
-                )
+            for draft_id, draft_data in (updates or {}).items():
+                await self._apply_update(draft_id, draft_data, user_id)
             
-            # Step 4: Delete draft only after successful project creation
-            # If deletion fails, log but don't fail the request (project is already created)
-            try:
-                self.delete_draft(draft_id, user_id=user_id)
-                logger.info(f"Draft {draft_id} deleted successfully after project creation")
-            except Exception as e:
-                # Log error but don't fail - project is already created
-                logger.warning(f"Failed to delete draft {draft_id} after project creation: {str(e)}")
-                logger.warning(f"Draft {draft_id} should be manually cleaned up. Project {project.id} was created successfully.")
-                # Don't raise - project creation was successful
-            
-            return project
+            query = select(ProjectDraft).where(ProjectDraft.id.in_(draft_ids)).with_for_update()
+            if user_id:
+                query = query.where(ProjectDraft.created_by == user_id)
+            drafts = {draft.id: draft for draft in (await self.db.scalars(query)).all()}
+            
+            choice_sets = await load_choice_sets()
+            defaults = ProjectService(self.db)
+            valid = []
+            for draft_id in draft_ids:
+                draft = drafts.get(draft_id)
+                if draft is None:
+                    errors.append({
+                        "draft_id": draft_id,
+                        "status_code": status.HTTP_404_NOT_FOUND,
+                        "error": f"Project draft with ID {draft_id} not found"
+                    })
+                    continue
+                try:
+                    project_data = self.convert_draft_to_project_create(draft)
+                except HTTPException as e:
+                    errors.append({"draft_id": draft_id, "status_code": e.status_code, "error": e.detail})
+                    continue
+                project_dict = project_data.model_dump()
+                choice_errors = check_choices(project_dict, choice_sets)
+                organization_error = check_organization_id(project_dict["organization_id"])
+                if organization_error:
+                    choice_errors.append(organization_error)
+                if choice_errors:
+                    errors.append({
+                        "draft_id": draft_id,
+                        "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        "error": "; ".join(choice_errors)
+                    })
+                    continue
+                defaults._apply_create_defaults(project_dict)
+                valid.append((draft_id, project_dict))
+            
+            if not valid:
+                await self.db.rollback()
+                return submitted, errors
+            
+            reference_ids = await ProjectReferenceAllocator(self.db).allocate(count=len(valid))
+            rows = [
+                {**project_dict, "project_reference_id": reference_id}
+                for (_, project_dict), reference_id in zip(valid, reference_ids)
+            ]
+            result = await self.db.execute(
+                insert(Project).returning(*Project.__mapper__.columns, sort_by_parameter_order=True),
+                rows,
+            )
+            projects = result.all()
+            valid_ids = [draft_id for draft_id, _ in valid]
+            await self.db.execute(
+                delete(ProjectDraft).where(ProjectDraft.id.in_(valid_ids)),
+                execution_options={"synchronize_session": False}
+            )
+            await self.db.commit()
             
         except HTTPException:
-            # Re-raise HTTPExceptions (validation errors, not found, etc.)
+            await self.db.rollback()
             raise
+        except IntegrityError as e:
+            await self.db.rollback()
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.error(f"Database integrity error submitting drafts {draft_ids}: {error_msg}")
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Database constraint violation: {error_msg}"
+            )
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            error_msg = str(e.orig) if hasattr(e, 'orig') else str(e)
+            logger.error(f"Database error submitting drafts {draft_ids}: {error_msg}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database error occurred while creating project. Please try again later."
+            )
         except Exception as e:
-            # Handle any unexpected errors
-            self.db.rollback()
-            logger.error(f"Unexpected error submitting draft {draft_id}: {str(e)}")
+            await self.db.rollback()
+            logger.error(f"Unexpected error submitting drafts {draft_ids}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to submit draft: {str(e)}"
             )
+        
+        project_count_cache.invalidate()
+        draft_count_cache.invalidate()
+        
+        for draft_id, project in zip(valid_ids, projects):
+            submitted.append({"draft_id": draft_id, "project": project})
+            logger.info(f"Project {project.id} created from draft {draft_id}")
+        return submitted, errors
 
@@ -0,0 +1,92 @@
+"""
+Streaming project export as CSV / JSON Lines
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import AsyncIterator, Iterable, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.logging import get_logger
+from app.models.project import Project
+from app.schemas.project import ProjectResponse
+from app.services.project_service import ProjectService
+
+logger = get_logger("services.project_export")
+
+# Media type per export format
+EXPORT_FORMATS = {"csv": "text/csv", "jsonl": "application/x-ndjson"}
+
+# Same fields, in the same order, as the API's ProjectResponse
+EXPORT_COLUMNS = [Project.__table__.c[name] for name in ProjectResponse.model_fields]
+EXPORT_FIELDS = [column.name for column in EXPORT_COLUMNS]
+
+
+def _export_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _encode_csv(rows: Iterable[Sequence], header: bool = False) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([_export_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def _encode_jsonl(rows: Iterable[Sequence]) -> bytes:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, row)), default=_export_value, ensure_ascii=False) + "\n"
+        for row in rows
+    ).encode("utf-8")
+
+
+async def stream_project_export(fmt: str, **filters) -> AsyncIterator[bytes]:
+    """Yield the filtered projects (newest first) as encoded chunks.
+
+    Rows come from a server-side cursor ``PROJECT_EXPORT_BATCH_SIZE`` at a
+    time as plain tuples (no ORM objects or pydantic models), and each batch
+    is encoded and yielded before the next is fetched, so memory stays flat
+    however many rows match. The session is owned by the generator because
+    it has to outlive the endpoint that returns the StreamingResponse.
+
+    The first chunk is only yielded once the query is running, so callers
+    can await it to surface database errors before the response starts.
+    """
+    async with AsyncSessionLocal(info={"replica_reads": True}) as db:
+        query = ProjectService(db).filter_projects(select(*EXPORT_COLUMNS), **filters)
+        query = query.order_by(Project.created_at.desc(), Project.id.desc())
+        try:
+            result = await db.stream(
+                query.execution_options(yield_per=settings.PROJECT_EXPORT_BATCH_SIZE)
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Database error starting project export: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database temporarily unavailable. Please try again later."
+            )
+
+        exported = 0
+        yield _encode_csv((), header=True) if fmt == "csv" else b""
+        try:
+            async for rows in result.partitions():
+                exported += len(rows)
+                yield _encode_csv(rows) if fmt == "csv" else _encode_jsonl(rows)
+        except SQLAlchemyError as e:
+            # Headers are already sent; all we can do is cut the stream short
+            logger.error(f"Database error after exporting {exported} projects: {str(e)}")
+            raise
+        logger.info(f"Exported {exported} projects as {fmt}")
@@ -0,0 +1,189 @@
+"""
+Bulk project import from CSV / JSON Lines uploads
+"""
+import csv
+import io
+import json
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.project import Project
+from app.schemas.project import ProjectCreate
+from app.services.organization_service import check_organization_id
+from app.services.project_reference_allocator import ProjectReferenceAllocator
+from app.services.project_service import ProjectService, project_count_cache
+from app.services.validation_service import check_choices, load_choice_sets
+
+logger = get_logger("services.project_import")
+
+IMPORT_FORMATS = ("csv", "jsonl")
+
+
+def detect_import_format(filename: Optional[str], content_type: Optional[str]) -> str:
+    """csv or jsonl from the upload's extension, falling back to its content type"""
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if content_type in ("text/csv", "application/csv"):
+        return "csv"
+    if content_type in ("application/x-ndjson", "application/jsonl", "application/x-jsonlines"):
+        return "jsonl"
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Unsupported import file. Upload a .csv or .jsonl file"
+    )
+
+
+def iter_import_rows(file: BinaryIO, fmt: str) -> Iterator[Tuple[int, Optional[dict], Optional[str]]]:
+    """Yield (row_number, values, parse_error) one record at a time.
+
+    Row numbers are 1-based data rows (the CSV header is not counted). Blank
+    CSV cells and JSON nulls are dropped so schema defaults apply.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="" if fmt == "csv" else None)
+    try:
+        if fmt == "csv":
+            for row_number, row in enumerate(csv.DictReader(text), start=1):
+                if None in row:
+                    yield row_number, None, "Row has more columns than the header"
+                    continue
+                yield row_number, {
+                    key.strip(): value.strip()
+                    for key, value in row.items()
+                    if key and value is not None and value.strip() != ""
+                }, None
+        else:
+            row_number = 0
+            for line in text:
+                if not line.strip():
+                    continue
+                row_number += 1
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield row_number, None, f"Invalid JSON: {str(e)}"
+                    continue
+                if not isinstance(record, dict):
+                    yield row_number, None, "Each line must be a JSON object"
+                    continue
+                yield row_number, {key: value for key, value in record.items() if value is not None}, None
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Import file must be UTF-8 encoded"
+        )
+    finally:
+        text.detach()
+
+
+def _format_validation_error(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in item['loc']) or 'row'}: {item['msg']}"
+        for item in error.errors()
+    ]
+
+
+class ProjectImportService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    def _validate_rows(self, file: BinaryIO, fmt: str, choice_sets: dict) -> Tuple[List[Tuple[int, dict]], List[dict]]:
+        """Parse and validate the upload row by row; returns (valid rows, errors)"""
+        defaults = ProjectService(self.db)
+        valid, errors = [], []
+        for row_number, values, parse_error in iter_import_rows(file, fmt):
+            if row_number > settings.PROJECT_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Import file exceeds {settings.PROJECT_IMPORT_MAX_ROWS} rows"
+                )
+            if parse_error:
+                errors.append({"row": row_number, "errors": [parse_error]})
+                continue
+            try:
+                project_dict = ProjectCreate.model_validate(values).model_dump()
+            except ValidationError as e:
+                errors.append({"row": row_number, "errors": _format_validation_error(e)})
+                continue
+            choice_errors = check_choices(project_dict, choice_sets)
+            organization_error = check_organization_id(project_dict["organization_id"])
+            if organization_error:
+                choice_errors.append(organization_error)
+            if choice_errors:
+                errors.append({"row": row_number, "errors": choice_errors})
+                continue
+            defaults._apply_create_defaults(project_dict)
+            valid.append((row_number, project_dict))
+        return valid, errors
+
+    async def import_projects(self, file: BinaryIO, fmt: str, all_or_nothing: bool = False) -> dict:
+        """Validate every row, then insert the valid ones in a single transaction.
+
+        Reference IDs are allocated as one block and the rows go in as one
+        multi-row INSERT ... RETURNING. With ``all_or_nothing`` nothing is
+        inserted if any row is invalid.
+        """
+        choice_sets = await load_choice_sets()
+        # Parsing and pydantic validation are CPU-bound; keep them off the event loop
+        valid, errors = await run_in_threadpool(self._validate_rows, file, fmt, choice_sets)
+        total = len(valid) + len(errors)
+        if total == 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Import file contains no rows"
+            )
+
+        imported = []
+        if valid and not (errors and all_or_nothing):
+            try:
+                reference_ids = await ProjectReferenceAllocator(self.db).allocate(count=len(valid))
+                rows = [
+                    {**project_dict, "project_reference_id": reference_id}
+                    for (_, project_dict), reference_id in zip(valid, reference_ids)
+                ]
+                result = await self.db.execute(
+                    insert(Project).returning(
+                        Project.id, Project.project_reference_id, sort_by_parameter_order=True
+                    ),
+                    rows,
+                )
+                inserted = result.all()
+                await self.db.commit()
+            except IntegrityError as e:
+                await self.db.rollback()
+                logger.error(f"Integrity error importing projects: {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Project import conflicts with existing data"
+                )
+            except SQLAlchemyError as e:
+                await self.db.rollback()
+                logger.error(f"Database error importing projects: {str(e)}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Database temporarily unavailable. Please try again later."
+                )
+            project_count_cache.invalidate()
+            imported = [
+                {"row": row_number, "id": project_id, "project_reference_id": reference_id}
+                for (row_number, _), (project_id, reference_id) in zip(valid, inserted)
+            ]
+            logger.info(f"Imported {len(imported)} of {total} projects ({len(errors)} rows rejected)")
+
+        return {
+            "total": total,
+            "succeeded": len(imported),
+            "failed": total - len(imported),
+            "projects": imported,
+            "errors": errors,
+        }
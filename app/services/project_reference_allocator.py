@@ -0,0 +1,61 @@
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import String, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.project_reference_counter import ProjectReferenceCounter
+
+
+def format_project_reference_id(year: int, sequence: int) -> str:
+    """Format: PROJ-YYYY-XXXXX (at least 5 digits, zero-padded)"""
+    return f"PROJ-{year}-{str(sequence).zfill(5)}"
+
+
+def project_reference_id_sql(year: int, sequence):
+    """SQL expression formatting a sequence number like format_project_reference_id"""
+    digits = cast(sequence, String)
+    return f"PROJ-{year}-" + func.lpad(digits, func.greatest(5, func.length(digits)), "0")
+
+
+def reserve_reference_ids(count: int, year: int = None) -> Tuple[int, object]:
+    """(year, upsert ... RETURNING last_value) reserving ``count`` numbers for year.
+
+    The statement can be executed directly or embedded as a CTE.
+    """
+    year = year or datetime.now().year
+    stmt = (
+        pg_insert(ProjectReferenceCounter)
+        .values(year=year, last_value=count)
+        .on_conflict_do_update(
+            index_elements=[ProjectReferenceCounter.year],
+            set_={
+                "last_value": ProjectReferenceCounter.last_value + count,
+                "updated_at": func.now(),
+            },
+        )
+        .returning(ProjectReferenceCounter.last_value)
+    )
+    return year, stmt
+
+
+class ProjectReferenceAllocator:
+    """Hands out PROJ-YYYY-NNNNN reference IDs from a per-year counter row.
+
+    One upsert ... RETURNING reserves ``count`` consecutive numbers in O(1),
+    without scanning perdix_mp_projects. The counter row is updated in the
+    caller's transaction, so a rolled-back create also releases its number
+    (no gaps) and concurrent creates wait on the row instead of colliding.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def allocate(self, count: int = 1, year: int = None) -> List[str]:
+        """Reserve ``count`` consecutive reference IDs for ``year`` (default: current year)"""
+        if count < 1:
+            return []
+        year, stmt = reserve_reference_ids(count, year)
+        last_value = (await self.db.execute(stmt)).scalar_one()
+        first_value = last_value - count + 1
+        return [format_project_reference_id(year, sequence) for sequence in range(first_value, last_value + 1)]
@@ -0,0 +1,154 @@
+"""
+Project search: Postgres full-text (search_vector) plus pg_trgm fuzzy matching
+"""
+from decimal import Decimal
+from typing import Optional, Tuple
+
+from sqlalchemy import Numeric, cast, func, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.pagination import CountCache, Page, decode_cursor, encode_cursor, resolve_total
+from app.models.project import SEARCH_CONFIG, Project
+
+logger = get_logger("services.project_search")
+
+# Search totals, keyed by free-text queries: kept apart from the listing
+# totals and bounded; they may lag project writes by LIST_TOTAL_CACHE_TTL
+search_count_cache = CountCache("project_search", settings.LIST_TOTAL_CACHE_TTL, settings.LIST_TOTAL_CACHE_MAX_ENTRIES)
+
+search_vector = Project.__table__.c.search_vector
+
+# HTML escapes applied to the text before ts_headline ("&" first); the
+# parser reads the entities as single non-word tokens, so matching is
+# unaffected and the only markup in a headline is the <mark> tags
+HTML_ESCAPES = (("&", "&amp;"), ("<", "&lt;"), (">", "&gt;"), ('"', "&quot;"), ("'", "&#39;"))
+
+# ts_headline options; matched terms are wrapped in <mark>...</mark>
+TITLE_HEADLINE_OPTIONS = "HighlightAll=true, StartSel=<mark>, StopSel=</mark>"
+DESCRIPTION_HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=30, MinWords=12, StartSel=<mark>, StopSel=</mark>"
+
+# ts_rank_cd normalization: rank / (rank + 1), so it stays in 0-1 like word_similarity
+RANK_NORMALIZATION = 32
+
+
+def html_escaped(column):
+    """SQL expression for column's text with HTML special characters escaped"""
+    expression = func.coalesce(column, "")
+    for character, entity in HTML_ESCAPES:
+        expression = func.replace(expression, character, entity)
+    return expression
+
+
+class ProjectSearchService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self,
+        q: str,
+        state: str = None,
+        city: str = None,
+        category: str = None,
+        status: str = None,
+        limit: int = 20,
+        cursor: str = None,
+        total_mode: str = "exact",
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Page:
+        """Get a page of projects matching q, most relevant first.
+
+        A project matches when its search_vector matches q as a web-style
+        query (quotes, OR, -term) or when q is word-similar to its title or
+        description (typos, partial words); both are served by GIN indexes.
+        Rank is ts_rank_cd plus title word similarity, rounded so it can key
+        the cursor. Items are rows of (Project, rank, title_highlight,
+        description_highlight); highlights are HTML-escaped text with
+        <mark> tags. ``fields`` limits the Project columns loaded.
+        """
+        query_terms = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        rank = func.round(
+            cast(
+                func.ts_rank_cd(search_vector, query_terms, RANK_NORMALIZATION) + func.word_similarity(q, Project.title),
+                Numeric
+            ),
+            6
+        )
+        matches = select(Project.id, rank.label("rank")).where(
+            or_(
+                search_vector.op("@@")(query_terms),
+                Project.title.op("%>")(q),
+                Project.description.op("%>")(q),
+            )
+        )
+        if state:
+            matches = matches.where(Project.state == state)
+        if city:
+            matches = matches.where(Project.city == city)
+        if category:
+            matches = matches.where(Project.category == category)
+        if status:
+            matches = matches.where(Project.status == status)
+
+        # Get total count
+        total = await resolve_total(
+            self.db,
+            matches,
+            total_mode,
+            search_count_cache,
+            (q, state, city, category, status)
+        )
+
+        # Keyset on (rank, id), highest first
+        direction = "next"
+        if cursor:
+            direction, rank_value, row_id = decode_cursor(cursor, Decimal)
+            position = tuple_(rank, Project.id)
+            if direction == "next":
+                matches = matches.where(position < tuple_(rank_value, row_id))
+            else:
+                matches = matches.where(position > tuple_(rank_value, row_id))
+        if direction == "next":
+            matches = matches.order_by(rank.desc(), Project.id.desc())
+        else:
+            matches = matches.order_by(rank.asc(), Project.id.asc())
+
+        # Headlines are costly, so they are built only for the page's rows
+        page = matches.limit(limit + 1).subquery("search_page")
+        query = (
+            select(
+                Project,
+                page.c.rank,
+                func.ts_headline(SEARCH_CONFIG, html_escaped(Project.title), query_terms, TITLE_HEADLINE_OPTIONS),
+                func.ts_headline(
+                    SEARCH_CONFIG,
+                    html_escaped(Project.description),
+                    query_terms,
+                    DESCRIPTION_HEADLINE_OPTIONS
+                ),
+            )
+            .join(page, Project.id == page.c.id)
+        )
+        if direction == "next":
+            query = query.order_by(page.c.rank.desc(), page.c.id.desc())
+        else:
+            query = query.order_by(page.c.rank.asc(), page.c.id.asc())
+        if fields is not None:
+            query = query.options(load_only(*(getattr(Project, name) for name in set(fields) | {"id"})))
+
+        # One extra row tells whether another page exists
+        rows = (await self.db.execute(query)).all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if direction == "prev":
+            rows.reverse()
+        if not rows:
+            return Page(rows, total, None, None)
+
+        has_next = has_more if direction == "next" else True
+        has_prev = bool(cursor) if direction == "next" else has_more
+        next_cursor = encode_cursor("next", rows[-1].rank, rows[-1][0].id) if has_next else None
+        prev_cursor = encode_cursor("prev", rows[0].rank, rows[0][0].id) if has_prev else None
+        return Page(rows, total, next_cursor, prev_cursor)
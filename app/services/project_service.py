@@ -1,127 +1,120 @@
-from typing import Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from typing import Optional, Tuple
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import load_only
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from decimal import Decimal
-from datetime import datetime
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import ProjectCreate, ProjectUpdate, ProjectResponse, ProjectSummaryResponse
+from app.services.organization_service import validate_organization_id
+from app.services.project_reference_allocator import ProjectReferenceAllocator
+from app.services.validation_service import validate_choices
+from app.core.config import settings
+from app.core.db_routing import pin_to_primary
 from app.core.logging import get_logger
+from app.core.pagination import CountCache, Page, keyset_paginate, resolve_total
 
 logger = get_logger("services.project")
 
+# Exact listing totals, reused per worker for a few seconds
+project_count_cache = CountCache("projects", settings.LIST_TOTAL_CACHE_TTL, settings.LIST_TOTAL_CACHE_MAX_ENTRIES)
+
+
+# Response columns, in ProjectResponse order (for serializing rows directly)
+PROJECT_RESPONSE_FIELDS = tuple(ProjectResponse.model_fields)
+
+
+def resolve_project_fields(fields: Optional[str]) -> Optional[Tuple[str, ...]]:
+    """Parse a ``fields=`` value into ProjectResponse field names (None = all).
+
+    ``summary`` selects the ProjectSummaryResponse columns; otherwise a
+    comma-separated list, always including ``id``.
+    """
+    if not fields:
+        return None
+    if fields.strip() == "summary":
+        return tuple(ProjectSummaryResponse.model_fields)
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(PROJECT_RESPONSE_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    requested.add("id")
+    return tuple(name for name in PROJECT_RESPONSE_FIELDS if name in requested)
+
 
 class ProjectService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    def _generate_project_reference_id(self) -> str:
-        """Generate unique project reference ID: PROJ-YYYY-XXXXX"""
-        current_year = datetime.now().year
-        
-        # Get the count of projects created this year
-        count_query = self.db.query(func.count(Project.id)).filter(
-            func.extract('year', Project.created_at) == current_year
-        )
-        count = count_query.scalar() or 0
-        
-        # Format: PROJ-YYYY-XXXXX (5 digits, zero-padded)
-        sequence = str(count + 1).zfill(5)
-        return f"PROJ-{current_year}-{sequence}"
+    async def _generate_project_reference_id(self) -> str:
+        """Allocate the next PROJ-YYYY-XXXXX from the per-year counter (no table scan)"""
+        return (await ProjectReferenceAllocator(self.db).allocate())[0]
     
-    def _validate_project_reference_id_unique(self, project_reference_id: str, exclude_id: int = None):
-        """Validate that project_reference_id is unique"""
-        query = self.db.query(Project).filter(Project.project_reference_id == project_reference_id)
-        if exclude_id:
-            query = query.filter(Project.id != exclude_id)
-        existing = query.first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail=f"Project reference ID '{project_reference_id}' already exists"
-            )
-    
-    def _validate_status(self, status_value: str):
-        """Validate project status"""
-        valid_statuses = ['draft', 'pending_validation', 'active', 'funding_completed', 'closed', 'rejected']
-        if status_value and status_value not in valid_statuses:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-            )
-    
-    def _validate_project_stage(self, stage: str):
-        """Validate project stage"""
-        valid_stages = ['planning', 'initiated', 'in_progress']
-        if stage and stage not in valid_stages:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid project stage. Must be one of: {', '.join(valid_stages)}"
-            )
-    
-    def _validate_visibility(self, visibility: str):
-        """Validate project visibility"""
-        valid_visibilities = ['private', 'public']
-        if visibility and visibility not in valid_visibilities:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid visibility. Must be one of: {', '.join(valid_visibilities)}"
-            )
+    def _apply_create_defaults(self, project_dict: dict) -> None:
+        """Fill backend defaults for a new project in place"""
+        if 'already_secured_funds' not in project_dict or project_dict['already_secured_funds'] is None:
+            project_dict['already_secured_funds'] = Decimal('0')
+        # Currency is always set by backend (ignore frontend value)
+        project_dict['currency'] = 'INR'
+        if 'status' not in project_dict or project_dict['status'] is None:
+            project_dict['status'] = 'draft'
+        if 'visibility' not in project_dict or project_dict['visibility'] is None:
+            project_dict['visibility'] = 'private'
+        if 'project_stage' not in project_dict or project_dict['project_stage'] is None:
+            project_dict['project_stage'] = 'planning'
+        if 'funding_raised' not in project_dict or project_dict['funding_raised'] is None:
+            project_dict['funding_raised'] = Decimal('0')
     
-    def create_project(self, project_data: ProjectCreate) -> Project:
+    async def create_project(self, project_data: ProjectCreate) -> Project:
         """Create a new project"""
         logger.info(f"Creating project: {project_data.title}")
         
         try:
-            # Validate status, stage, and visibility
-            self._validate_status(project_data.status)
-            self._validate_project_stage(project_data.project_stage)
-            self._validate_visibility(project_data.visibility)
+            project_dict = project_data.model_dump(exclude_unset=True)
+            
+            # Validate status, stage, visibility, category and organization
+            await validate_choices(project_dict)
+            validate_organization_id(project_dict['organization_id'])
             
-            # Generate project reference ID
-            project_reference_id = self._generate_project_reference_id()
-            self._validate_project_reference_id_unique(project_reference_id)
+            # Generate project reference ID (unique by construction)
+            project_reference_id = await self._generate_project_reference_id()
             
             # Create project
-            project_dict = project_data.model_dump(exclude_unset=True)
             project_dict['project_reference_id'] = project_reference_id
             
             # Set defaults
-            if 'already_secured_funds' not in project_dict or project_dict['already_secured_funds'] is None:
-                project_dict['already_secured_funds'] = Decimal('0')
-            # Currency is always set by backend (ignore frontend value)
-            project_dict['currency'] = 'INR'
-            if 'status' not in project_dict or project_dict['status'] is None:
-                project_dict['status'] = 'draft'
-            if 'visibility' not in project_dict or project_dict['visibility'] is None:
-                project_dict['visibility'] = 'private'
-            if 'project_stage' not in project_dict or project_dict['project_stage'] is None:
-                project_dict['project_stage'] = 'planning'
-            if 'funding_raised' not in project_dict or project_dict['funding_raised'] is None:
-                project_dict['funding_raised'] = Decimal('0')
+            self._apply_create_defaults(project_dict)
             
             project = Project(**project_dict)
             self.db.add(project)
-            self.db.commit()
-            self.db.refresh(project)
+            # INSERT ... RETURNING fills id, timestamps and generated columns
+            await self.db.commit()
+            project_count_cache.invalidate()
             
             logger.info(f"Project {project.id} created successfully with reference ID: {project.project_reference_id}")
             return project
             
         except HTTPException:
-            self.db.rollback()
+            await self.db.rollback()
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error creating project: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to create project: {str(e)}"
             )
     
-    def get_project_by_id(self, project_id: int) -> Project:
+    async def get_project_by_id(self, project_id: int) -> Project:
         """Get project by ID"""
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+        query = select(Project).where(Project.id == project_id)
+        project = await self.db.scalar(query)
+        if not project and pin_to_primary(self.db):
+            # Possibly created moments ago and not yet on the replica
+            project = await self.db.scalar(query)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -129,9 +122,12 @@ class ProjectService:
             )
         return project
     
-    def get_project_by_reference_id(self, project_reference_id: str) -> Project:
+    async def get_project_by_reference_id(self, project_reference_id: str) -> Project:
         """Get project by reference ID"""
-        project = self.db.query(Project).filter(Project.project_reference_id == project_reference_id).first()
+        query = select(Project).where(Project.project_reference_id == project_reference_id)
+        project = await self.db.scalar(query)
+        if not project and pin_to_primary(self.db):
+            project = await self.db.scalar(query)
         if not project:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -139,43 +135,77 @@ class ProjectService:
             )
         return project
     
-    def get_projects(
+    def filter_projects(
         self,
-        skip: int = 0,
-        limit: int = 100,
+        query,
         organization_id: str = None,
         organization_type: str = None,
         status: str = None,
         visibility: str = None
-    ) -> Tuple[list[Project], int]:
-        """Get list of projects with optional filters"""
-        query = self.db.query(Project)
-        
-        # Apply filters
+    ):
+        """Apply the project listing filters to a select()"""
         if organization_id:
-            query = query.filter(Project.organization_id == organization_id)
+            query = query.where(Project.organization_id == organization_id)
         if organization_type:
-            query = query.filter(Project.organization_type == organization_type)
+            query = query.where(Project.organization_type == organization_type)
         if status:
-            query = query.filter(Project.status == status)
+            query = query.where(Project.status == status)
         if visibility:
-            query = query.filter(Project.visibility == visibility)
+            query = query.where(Project.visibility == visibility)
+        return query
+    
+    async def get_projects(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        organization_id: str = None,
+        organization_type: str = None,
+        status: str = None,
+        visibility: str = None,
+        cursor: str = None,
+        total_mode: str = "exact",
+        fields: Optional[Tuple[str, ...]] = None
+    ) -> Page:
+        """Get a page of projects (newest first) with optional filters.
+
+        Pages are keyed on (created_at, id) via ``cursor``; ``total_mode``
+        picks a cached exact total, a planner estimate, or no total.
+        ``fields`` limits the SELECT to those columns (plus the keyset
+        columns); other attributes are left unloaded and must not be read.
+        """
+        query = self.filter_projects(
+            select(Project),
+            organization_id=organization_id,
+            organization_type=organization_type,
+            status=status,
+            visibility=visibility
+        )
         
         # Get total count
-        total = query.count()
+        total = await resolve_total(
+            self.db,
+            query,
+            total_mode,
+            project_count_cache,
+            (organization_id, organization_type, status, visibility)
+        )
+        
+        if fields is not None:
+            columns = set(fields) | {"id", "created_at"}
+            query = query.options(load_only(*(getattr(Project, name) for name in columns)))
         
         # Apply pagination
-        projects = query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
+        projects, next_cursor, prev_cursor = await keyset_paginate(
+            self.db, query, Project.created_at, Project.id, limit, cursor=cursor, skip=skip
+        )
         
-        return projects, total
+        return Page(projects, total, next_cursor, prev_cursor)
     
-    def update_project(self, project_id: int, project_data: ProjectUpdate) -> Project:
+    async def update_project(self, project_id: int, project_data: ProjectUpdate) -> Project:
         """Update an existing project"""
         logger.info(f"Updating project {project_id}")
         
         try:
-            project = self.get_project_by_id(project_id)
-            
             # Validate status, stage, and visibility if provided
             update_dict = project_data.model_dump(exclude_unset=True)
             
@@ -184,53 +214,58 @@ class ProjectService:
                 logger.warning(f"Attempted to update currency for project {project_id}. Currency is backend-controlled and will be ignored.")
                 del update_dict['currency']
             
-            if 'status' in update_dict:
-                self._validate_status(update_dict['status'])
-            if 'project_stage' in update_dict:
-                self._validate_project_stage(update_dict['project_stage'])
-            if 'visibility' in update_dict:
-                self._validate_visibility(update_dict['visibility'])
+            await validate_choices(update_dict)
+            if update_dict.get('organization_id'):
+                validate_organization_id(update_dict['organization_id'])
             
-            # Update fields
-            for field, value in update_dict.items():
-                setattr(project, field, value)
-            
-            # Update updated_at timestamp
-            project.updated_at = datetime.now()
+            # One UPDATE ... RETURNING both applies the change and reads back the
+            # row, including the recomputed generated columns
+            project = await self.db.scalar(
+                update(Project)
+                .where(Project.id == project_id)
+                .values(**update_dict, updated_at=func.now())
+                .returning(Project)
+            )
+            if not project:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Project with ID {project_id} not found"
+                )
             
-            self.db.commit()
-            self.db.refresh(project)
+            await self.db.commit()
+            project_count_cache.invalidate()
             
             logger.info(f"Project {project.id} updated successfully")
             return project
             
         except HTTPException:
-            self.db.rollback()
+            await self.db.rollback()
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error updating project {project_id}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to update project: {str(e)}"
             )
     
-    def delete_project(self, project_id: int) -> None:
+    async def delete_project(self, project_id: int) -> None:
         """Delete a project"""
         logger.info(f"Deleting project {project_id}")
         
         try:
-            project = self.get_project_by_id(project_id)
-            self.db.delete(project)
-            self.db.commit()
+            project = await self.get_project_by_id(project_id)
+            await self.db.delete(project)
+            await self.db.commit()
+            project_count_cache.invalidate()
             
             logger.info(f"Project {project_id} deleted successfully")
             
         except HTTPException:
-            self.db.rollback()
+            await self.db.rollback()
             raise
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error deleting project {project_id}: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
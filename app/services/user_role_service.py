@@ -1,10 +1,19 @@
-import httpx
 from fastapi import HTTPException, status
+from app.core.cache import AsyncTTLCache, is_success_response
 from app.core.config import settings
+from app.core.perdix_client import PerdixClient
 from app.schemas.user_role import UserRoleCreate, UserRoleUpdate
 
+# Role catalog changes rarely; shared with master_service.fetch_roles_from_perdix
+role_catalog_cache = AsyncTTLCache(
+    "perdix_roles",
+    ttl=settings.PERDIX_ROLE_CACHE_TTL,
+    stale_ttl=settings.PERDIX_ROLE_CACHE_STALE_TTL,
+    cacheable=is_success_response,
+)
 
-def create_user_role_in_perdix(payload: UserRoleCreate) -> tuple:
+
+async def create_user_role_in_perdix(client: PerdixClient, payload: UserRoleCreate) -> tuple:
     """Create a new user role in Perdix system"""
     base = settings.PERDIX_ORIGIN.rstrip("/")
     url = f"{base}/management/user-management/updateRole.php"
@@ -31,19 +40,13 @@ def create_user_role_in_perdix(payload: UserRoleCreate) -> tuple:
         "team_code": None
     }
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.put(url, headers=headers, json=role_payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    result = await client.put(url, headers=headers, json=role_payload)
+    if result[1] in (200, 201):
+        role_catalog_cache.invalidate()
+    return result
 
 
-def update_user_role_in_perdix(role_id: int, payload: UserRoleUpdate) -> tuple:
+async def update_user_role_in_perdix(client: PerdixClient, role_id: int, payload: UserRoleUpdate) -> tuple:
     """Update an existing user role in Perdix system"""
     base = settings.PERDIX_ORIGIN.rstrip("/")
     url = f"{base}/management/user-management/updateRole.php"
@@ -72,20 +75,18 @@ def update_user_role_in_perdix(role_id: int, payload: UserRoleUpdate) -> tuple:
         "team_code": None
     }
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.put(url, headers=headers, json=role_payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    result = await client.put(url, headers=headers, json=role_payload)
+    if result[1] in (200, 201):
+        role_catalog_cache.invalidate()
+    return result
 
 
-def get_user_roles_from_perdix() -> tuple:
-    """Get all user roles from Perdix system"""
+async def get_user_roles_from_perdix(client: PerdixClient) -> tuple:
+    """Get all user roles from Perdix system (cached)"""
+    return await role_catalog_cache.get_or_load("user_roles", lambda: _fetch_user_roles_from_perdix(client))
+
+
+async def _fetch_user_roles_from_perdix(client: PerdixClient) -> tuple:
     base = settings.PERDIX_ORIGIN.rstrip("/")
     url = f"{base}/management/user-management/allRoles.php"
     
@@ -104,13 +105,4 @@ def get_user_roles_from_perdix() -> tuple:
         "sec-fetch-site": "same-origin",
     }
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, dedupe=True)
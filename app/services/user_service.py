@@ -1,9 +1,26 @@
-import httpx
+import asyncio
 from fastapi import HTTPException, status
+from app.core.cache import AsyncTTLCache, is_not_found_response, is_success_response
 from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.perdix_client import PerdixClient
 
+logger = get_logger("services.user")
 
-def create_user_in_perdix(payload: dict) -> tuple:
+# Per-login profile cache; 404s are cached briefly so repeated lookups of
+# unknown logins do not reach Perdix either
+user_profile_cache = AsyncTTLCache(
+    "perdix_user_profiles",
+    ttl=settings.PERDIX_USER_CACHE_TTL,
+    stale_ttl=settings.PERDIX_USER_CACHE_STALE_TTL,
+    cacheable=is_success_response,
+    negative=is_not_found_response,
+    negative_ttl=settings.PERDIX_USER_CACHE_NEGATIVE_TTL,
+    maxsize=settings.PERDIX_USER_CACHE_MAXSIZE,
+)
+
+
+async def create_user_in_perdix(client: PerdixClient, payload: dict) -> tuple:
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/users"
 
@@ -19,22 +36,14 @@ def create_user_in_perdix(payload: dict) -> tuple:
         "page_uri": settings.PERDIX_PAGE_URI,
     }
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, headers=headers, json=payload)
-    except httpx.HTTPError as exc:
-        # Network/transport error, not a Perdix application response
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    # Return raw Perdix response body and status for the caller to forward
-    try:
-        body = response.json()
-        return body, response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
-
-def get_user_from_perdix_by_login(login: str) -> tuple:
-    """Get single user details from Perdix by login/username"""
+    return await client.post(url, headers=headers, json=payload)
+
+async def get_user_from_perdix_by_login(client: PerdixClient, login: str) -> tuple:
+    """Get single user details from Perdix by login/username (cached)"""
+    return await user_profile_cache.get_or_load(login, lambda: _fetch_user_from_perdix_by_login(client, login))
+
+
+async def _fetch_user_from_perdix_by_login(client: PerdixClient, login: str) -> tuple:
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/users/{login}"
 
@@ -58,18 +67,9 @@ def get_user_from_perdix_by_login(login: str) -> tuple:
         "origin": settings.PERDIX_ORIGIN,
     }
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, endpoint="GET /api/users/{login}", dedupe=True)
 
-def update_user_in_perdix(payload: dict) -> tuple:
+async def update_user_in_perdix(client: PerdixClient, payload: dict) -> tuple:
     """Update user details in Perdix using maintenance endpoint (PUT /api/users)"""
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/users"
@@ -95,18 +95,12 @@ def update_user_in_perdix(payload: dict) -> tuple:
         "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36",
     }
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.put(url, headers=headers, json=payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
+    result = await client.put(url, headers=headers, json=payload)
+    if result[1] in (200, 201) and isinstance(payload, dict) and payload.get("login"):
+        user_profile_cache.invalidate(payload["login"])
+    return result
 
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
-
-def update_user_roles_in_perdix(user_payload: dict) -> tuple:
+async def update_user_roles_in_perdix(client: PerdixClient, user_payload: dict) -> tuple:
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/users"
 
@@ -121,124 +115,152 @@ def update_user_roles_in_perdix(user_payload: dict) -> tuple:
         "page_uri": "Page/Engine/management.UserRoles",
     }
 
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.put(url, headers=headers, json=user_payload)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-
-    try:
-        body = response.json()
-        return body, response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
-
-
-def _build_user_create_payload(payload) -> dict:
+    return await client.put(url, headers=headers, json=user_payload)
+
+
+# Registration fields: schema attribute -> camelCase key used by raw dict payloads
+_REGISTRATION_FIELDS = {
+    "full_name": "fullName",
+    "login": "login",
+    "password": "password",
+    "confirm_password": "confirmPassword",
+    "email": "email",
+    "mobile_number": "mobileNumber",
+    "user_roles": "userRoles",
+}
+
+# Constant parts of the Perdix payloads, built once at import time
+_USER_CREATE_TEMPLATE = {
+    "roleCode": "A",
+    "activated": True,
+    "userState": "ACTIVE",
+    "userType": "A",
+    "bankName": "Witfin",
+    "validUntil": "2035-09-22",
+    "accessType": "BRANCH",
+    "imeiNumber": "",
+    "langKey": "en",
+    "branchId": 12,
+    "branchName": "Head Office",
+    "changePasswordOnLogin": True,
+}
+
+_ROLE_UPDATE_TEMPLATE = {
+    "password": None,
+    "changePasswordOnLogin": True,
+    "firstName": None,
+    "lastName": None,
+    "langKey": "en",
+    "roleCode": "A",
+    "activated": True,
+    "roles": None,
+    "branchSetCode": None,
+    "bankName": "Witfin",
+    "branchName": "Head Office",
+    "agentAmtLimit": None,
+    "imeiNumber": "",
+    "branchId": 12,
+    "branchCode": None,
+    "userState": "ACTIVE",
+    "activeBranch": "Head Office",
+    "activeBranchId": None,
+    "userType": "A",
+    "landlineNumber": None,
+    "validUntil": "2035-09-22",
+    "accessType": "BRANCH",
+    "customerId": None,
+    "villageName": None,
+    "editCheckerAccess": False,
+    "agentAllVillageAccess": False,
+    "urnNo": None,
+    "agentId": None,
+    "employeeId": None,
+    "mobileNumber2": None,
+    "partnerCode": None,
+    "otp": None,
+    "otpPurpose": None,
+    "userAccountLockStatus": None,
+    "accountLockedAt": None,
+    "accountLockReason": None,
+    "imeiOverrideRequired": False,
+    "mfaToken": None,
+    "mfaTokenExpired": None,
+    "mfaRequired": False,
+    "photoImageId": None,
+    "externalSystemCode": None,
+    "apiUser": False,
+    "hsmUserId": None,
+}
+
+
+def _extract_registration_fields(payload) -> dict:
+    """Read registration fields once from a schema object or a camelCase dict"""
+    if isinstance(payload, dict):
+        fields = {attr: payload.get(key) for attr, key in _REGISTRATION_FIELDS.items()}
+    else:
+        fields = {attr: getattr(payload, attr, None) for attr in _REGISTRATION_FIELDS}
+        if fields["email"] is not None:
+            fields["email"] = str(fields["email"])
+    return fields
+
+
+def _build_user_create_payload(fields: dict) -> dict:
     return {
-        "roleCode": "A",
-        "activated": True,
-        "userState": "ACTIVE",
-        "userType": "A",
-        "bankName": "Witfin",
-        "validUntil": "2035-09-22",
-        "accessType": "BRANCH",
-        "imeiNumber": "",
-        "langKey": "en",
+        **_USER_CREATE_TEMPLATE,
         "userRoles": [],
         "userBranches": [],
-        "userName": getattr(payload, "full_name", None) if hasattr(payload, "full_name") else payload.get("fullName"),
-        "login": getattr(payload, "login", None) if hasattr(payload, "login") else payload.get("login"),
-        "password": getattr(payload, "password", None) if hasattr(payload, "password") else payload.get("password"),
-        "confirmPassword": getattr(payload, "confirm_password", None) if hasattr(payload, "confirm_password") else payload.get("confirmPassword"),
-        "email": str(getattr(payload, "email", None)) if hasattr(payload, "email") else payload.get("email"),
-        "mobileNumber": getattr(payload, "mobile_number", None) if hasattr(payload, "mobile_number") else payload.get("mobileNumber"),
-        "branchId": 12,
-        "branchName": "Head Office",
-        "changePasswordOnLogin": True,
+        "userName": fields["full_name"],
+        "login": fields["login"],
+        "password": fields["password"],
+        "confirmPassword": fields["confirm_password"],
+        "email": fields["email"],
+        "mobileNumber": fields["mobile_number"],
     }
 
 
-def _build_role_update_payload(created_body: dict, payload) -> dict:
-    mobile_number = getattr(payload, "mobile_number", None) if hasattr(payload, "mobile_number") else payload.get("mobileNumber")
+def _build_role_update_payload(created_body: dict, fields: dict) -> dict:
+    created_body = created_body or {}
+    mobile_number = fields["mobile_number"]
     return {
-        "id": (created_body or {}).get("id"),
-        "version": (created_body or {}).get("version", 0),
-        "login": getattr(payload, "login", None) if hasattr(payload, "login") else payload.get("login"),
-        "password": None,
-        "userName": getattr(payload, "full_name", None) if hasattr(payload, "full_name") else payload.get("fullName"),
-        "changePasswordOnLogin": True,
-        "firstName": None,
-        "lastName": None,
-        "email": str(getattr(payload, "email", None)) if hasattr(payload, "email") else payload.get("email"),
-        "langKey": "en",
-        "roleCode": "A",
-        "activated": True,
-        "roles": None,
-        "branchSetCode": None,
-        "bankName": "Witfin",
-        "branchName": "Head Office",
-        "agentAmtLimit": None,
-        "imeiNumber": "",
-        "branchId": 12,
-        "branchCode": None,
-        "userState": "ACTIVE",
-        "activeBranch": "Head Office",
-        "activeBranchId": None,
-        "userType": "A",
+        **_ROLE_UPDATE_TEMPLATE,
+        "id": created_body.get("id"),
+        "version": created_body.get("version", 0),
+        "login": fields["login"],
+        "userName": fields["full_name"],
+        "email": fields["email"],
         "mobileNumber": str(mobile_number) if mobile_number is not None else None,
-        "landlineNumber": None,
-        "validUntil": "2035-09-22",
-        "lastPasswordUpdatedOn": (created_body or {}).get("lastPasswordUpdatedOn"),
-        "accessType": "BRANCH",
-        "customerId": None,
-        "villageName": None,
-        "editCheckerAccess": False,
-        "agentAllVillageAccess": False,
-        "urnNo": None,
-        "agentId": None,
-        "employeeId": None,
-        "mobileNumber2": None,
-        "userRoles": getattr(payload, "user_roles", None) if hasattr(payload, "user_roles") else payload.get("userRoles"),
+        "lastPasswordUpdatedOn": created_body.get("lastPasswordUpdatedOn"),
+        "userRoles": fields["user_roles"],
         "userBranches": [
             {
                 "id": None,
                 "version": 0,
-                "userId": getattr(payload, "login", None) if hasattr(payload, "login") else payload.get("login"),
+                "userId": fields["login"],
                 "branchId": 12,
             }
         ],
-        "partnerCode": None,
-        "otp": None,
-        "otpPurpose": None,
         "allowedDevices": [],
-        "userAccountLockStatus": None,
-        "accountLockedAt": None,
-        "accountLockReason": None,
-        "imeiOverrideRequired": False,
-        "mfaToken": None,
-        "mfaTokenExpired": None,
-        "mfaRequired": False,
-        "photoImageId": None,
-        "externalSystemCode": None,
-        "apiUser": False,
-        "hsmUserId": None,
     }
 
 
-def register_user_with_optional_roles(payload) -> tuple:
+async def register_user_with_optional_roles(client: PerdixClient, payload) -> tuple:
+    fields = _extract_registration_fields(payload)
+
     # Build user creation payload and call Perdix
-    create_payload = _build_user_create_payload(payload)
-    body, status_code, is_json = create_user_in_perdix(create_payload)
+    create_payload = _build_user_create_payload(fields)
+    body, status_code, is_json = await create_user_in_perdix(client, create_payload)
+    if status_code in (200, 201):
+        # Drop any cached 404 for the new login
+        user_profile_cache.invalidate(create_payload["login"])
 
     # If creation failed or no roles provided, return the creation response
-    roles = getattr(payload, "user_roles", None) if hasattr(payload, "user_roles") else (payload.get("userRoles") if isinstance(payload, dict) else None)
-    if status_code not in (200, 201) or not roles:
+    if status_code not in (200, 201) or not fields["user_roles"]:
         return body, status_code, is_json
 
     # Build roles payload and call update
-    role_update_payload = _build_role_update_payload(body if isinstance(body, dict) else {}, payload)
-    role_body, role_status, role_is_json = update_user_roles_in_perdix(role_update_payload)
+    role_update_payload = _build_role_update_payload(body if isinstance(body, dict) else {}, fields)
+    role_body, role_status, role_is_json = await update_user_roles_in_perdix(client, role_update_payload)
+    user_profile_cache.invalidate(role_update_payload["login"])
 
     if role_status not in (200, 201):
         return role_body, role_status, role_is_json
@@ -251,7 +273,49 @@ def register_user_with_optional_roles(payload) -> tuple:
     }, 201, True
 
 
-def get_users_from_perdix(branch_name: str = None, page: int = 1, per_page: int = 10) -> tuple:
+async def register_users_bulk(client: PerdixClient, payloads: list, concurrency: int) -> dict:
+    """Register many users with bounded concurrency and report per-item results
+
+    Each user still runs create -> role assignment in order; up to
+    ``concurrency`` users are in flight at once. One failing user never
+    aborts the rest of the batch.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def register_one(index: int, payload) -> dict:
+        login = payload.get("login") if isinstance(payload, dict) else getattr(payload, "login", None)
+        async with semaphore:
+            try:
+                login = _extract_registration_fields(payload)["login"]
+                body, status_code, is_json = await register_user_with_optional_roles(client, payload)
+            except HTTPException as exc:
+                body, status_code, is_json = exc.detail, exc.status_code, False
+            except Exception as exc:
+                # Malformed payloads, unexpected Perdix bodies, transport errors: this user only
+                logger.error(f"Bulk registration of '{login}' raised: {str(exc)}")
+                body, status_code, is_json = f"Registration failed: {str(exc)}", status.HTTP_500_INTERNAL_SERVER_ERROR, False
+        succeeded = status_code in (200, 201)
+        if not succeeded:
+            logger.warning(f"Bulk registration of '{login}' failed with status {status_code}")
+        return {
+            "index": index,
+            "login": login,
+            "status": "success" if succeeded else "error",
+            "statusCode": status_code,
+            "data": body if is_json else {"raw": body},
+        }
+
+    results = await asyncio.gather(*(register_one(i, payload) for i, payload in enumerate(payloads)))
+    succeeded = sum(1 for result in results if result["status"] == "success")
+    return {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results,
+    }
+
+
+async def get_users_from_perdix(client: PerdixClient, branch_name: str = None, page: int = 1, per_page: int = 10) -> tuple:
     """Get users list from Perdix system with pagination and optional branch filter"""
     base_url = settings.PERDIX_BASE_URL.rstrip("/")
     url = f"{base_url}/api/users"
@@ -280,14 +344,5 @@ def get_users_from_perdix(branch_name: str = None, page: int = 1, per_page: int
         "sec-fetch-site": "same-origin",
     }
     
-    try:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, headers=headers, params=params)
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc))
-    
-    try:
-        return response.json(), response.status_code, True
-    except ValueError:
-        return response.text, response.status_code, False
+    return await client.get(url, headers=headers, params=params, dedupe=True)
 
@@ -0,0 +1,73 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from fastapi import HTTPException, status
+from app.core.logging import get_logger
+from app.services.master_service import get_master_snapshot
+
+logger = get_logger("services.validation")
+
+
+class ChoiceRule(NamedTuple):
+    label: str
+    static: Optional[frozenset]  # Fixed allowed values (mirror the table CHECK constraints)
+    master: Optional[str]  # Master list whose values are allowed, when loaded and non-empty;
+                           # with static set, only master values also in static count
+
+
+# Shared by ProjectService and ProjectDraftService
+CHOICE_RULES = {
+    "status": ChoiceRule(
+        "status",
+        frozenset({'draft', 'pending_validation', 'active', 'funding_completed', 'closed', 'rejected'}),
+        None,
+    ),
+    "project_stage": ChoiceRule("project stage", frozenset({'planning', 'initiated', 'in_progress'}), "project_stages"),
+    "visibility": ChoiceRule("visibility", frozenset({'private', 'public'}), None),
+    # Free text until the category master has rows
+    "category": ChoiceRule("category", None, "project_categories"),
+}
+
+
+async def _allowed_values(rule: ChoiceRule) -> Optional[frozenset]:
+    if rule.master:
+        try:
+            snapshot = await get_master_snapshot(rule.master)
+            values = snapshot.values
+            if values and rule.static is not None:
+                # A value the CHECK constraint rejects would only fail later as an IntegrityError
+                outside = values - rule.static
+                if outside:
+                    logger.debug(
+                        f"Master list '{rule.master}' values not allowed by the database: {', '.join(sorted(outside))}"
+                    )
+                values = values & rule.static
+            if values:
+                return values
+        except Exception as e:
+            logger.warning(f"Master list '{rule.master}' unavailable for validation: {str(e)}")
+    return rule.static
+
+
+async def load_choice_sets(fields: Iterable[str] = CHOICE_RULES) -> Dict[str, Optional[frozenset]]:
+    """Allowed values per field (None = unrestricted), for checking many payloads"""
+    return {field: await _allowed_values(CHOICE_RULES[field]) for field in fields}
+
+
+def check_choices(values: dict, choice_sets: Dict[str, Optional[frozenset]]) -> List[str]:
+    """Error messages for every enumerated field in values outside its allowed set"""
+    errors = []
+    for field, allowed in choice_sets.items():
+        value = values.get(field)
+        if value and allowed is not None and value not in allowed:
+            errors.append(f"Invalid {CHOICE_RULES[field].label}. Must be one of: {', '.join(sorted(allowed))}")
+    return errors
+
+
+async def validate_choices(values: dict, fields: Iterable[str] = CHOICE_RULES) -> None:
+    """Check every enumerated field present in values; one 422 lists all invalid ones"""
+    choice_sets = await load_choice_sets(field for field in fields if values.get(field))
+    errors = check_choices(values, choice_sets)
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="; ".join(errors)
+        )
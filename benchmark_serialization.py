@@ -0,0 +1,112 @@
+"""
+Benchmark of list-page JSON encoding: pydantic + response_model vs direct rows + orjson
+
+Run from the project root:  python benchmark_serialization.py [rows] [repeats]
+
+"before" mirrors what GET /projects used to do per page: model_validate each
+ORM row into ProjectResponse, let FastAPI validate the envelope against
+response_model=ProjectListResponse, serialize it in JSON mode and render it
+with json.dumps. "after" is the current path: rows_to_dicts + orjson.
+No database is needed; rows are transient Project instances.
+"""
+import json
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from pydantic import TypeAdapter
+
+from app.core.serialization import dumps, rows_to_dicts
+from app.models.project import Project
+from app.schemas.project import ProjectListResponse, ProjectResponse
+from app.services.project_service import PROJECT_RESPONSE_FIELDS
+
+
+def make_rows(count: int) -> list:
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        Project(
+            id=i,
+            organization_type="municipal_corporation",
+            organization_id=f"ORG-{i % 50:04d}",
+            project_reference_id=f"PROJ-2026-{i:05d}",
+            title=f"Water supply augmentation phase {i}",
+            department="Public Works",
+            contact_person="Project Officer",
+            contact_person_email="officer@example.org",
+            category="Water Supply",
+            project_stage="planning",
+            description="Replace trunk mains and add storage reservoirs. " * 10,
+            start_date=date(2026, 4, 1),
+            end_date=date(2028, 3, 31),
+            state="Maharashtra",
+            city="Pune",
+            total_project_cost=Decimal("125000000.00"),
+            funding_requirement=Decimal("90000000.00"),
+            already_secured_funds=Decimal("35000000.00"),
+            commitment_gap=Decimal("55000000.00"),
+            currency="INR",
+            fundraising_start_date=created,
+            status="active",
+            visibility="public",
+            funding_raised=Decimal("1250000.00"),
+            funding_percentage=Decimal("1.39"),
+            created_at=created + timedelta(minutes=i),
+            updated_at=created + timedelta(minutes=i, seconds=30),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def envelope(data) -> dict:
+    return {
+        "status": "success",
+        "message": "Projects fetched successfully",
+        "data": data,
+        "total": len(data),
+        "next_cursor": None,
+        "prev_cursor": None,
+    }
+
+
+response_adapter = TypeAdapter(ProjectListResponse)
+
+
+def encode_before(rows) -> bytes:
+    content = envelope([ProjectResponse.model_validate(row) for row in rows])
+    validated = response_adapter.validate_python(content, from_attributes=True)
+    return json.dumps(response_adapter.dump_python(validated, mode="json")).encode("utf-8")
+
+
+def encode_after(rows) -> bytes:
+    return dumps(envelope(rows_to_dicts(rows, PROJECT_RESPONSE_FIELDS)))
+
+
+def best_of(func, rows, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    rows = make_rows(count)
+
+    # Both paths must produce the same document
+    assert json.loads(encode_before(rows)) == json.loads(encode_after(rows)), "outputs differ"
+
+    before = best_of(encode_before, rows, repeats)
+    after = best_of(encode_after, rows, repeats)
+    print(f"{count} rows, best of {repeats}")
+    print(f"  before (pydantic + json):  {before * 1000:8.2f} ms/page  {before / count * 1e6:7.2f} us/row")
+    print(f"  after  (rows + orjson):    {after * 1000:8.2f} ms/page  {after / count * 1e6:7.2f} us/row")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
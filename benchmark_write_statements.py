@@ -0,0 +1,77 @@
+"""
+Count the SQL statements each project/draft write issues
+
+Run from the project root against a development database:
+    python benchmark_write_statements.py
+
+Every operation runs through the real services inside one outer
+transaction that is rolled back at the end (service commits only release
+savepoints), so nothing is left behind. Master-data lookups used by choice
+validation are warmed first; they are cached and not part of a write.
+"""
+import asyncio
+from collections import Counter
+from decimal import Decimal
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import async_engine
+from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project_draft import ProjectDraftCreate, ProjectDraftUpdate
+from app.services.master_service import warm_master_data
+from app.services.project_draft_service import ProjectDraftService
+from app.services.project_service import ProjectService
+
+statements = Counter()
+
+
+def _count(conn, cursor, statement, parameters, context, executemany):
+    if statement.lstrip().upper().startswith(("SAVEPOINT", "RELEASE", "ROLLBACK")):
+        return
+    statements[statement.split(None, 1)[0].upper()] += 1
+
+
+def _report(operation: str) -> None:
+    total = sum(statements.values())
+    detail = ", ".join(f"{kind} x{count}" for kind, count in sorted(statements.items()))
+    print(f"  {operation:<16} {total} statement(s): {detail}")
+    statements.clear()
+
+
+async def main():
+    await warm_master_data()
+    async with async_engine.connect() as conn:
+        outer = await conn.begin()
+        event.listen(conn.sync_connection, "before_cursor_execute", _count)
+        db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+        try:
+            projects = ProjectService(db)
+            drafts = ProjectDraftService(db)
+            print("Statements per write (commit not counted)")
+
+            project = await projects.create_project(ProjectCreate(
+                organization_type="municipal_corporation",
+                organization_id="BENCH-ORG",
+                title="Statement count benchmark",
+                contact_person="Benchmark",
+                funding_requirement=Decimal("1000000"),
+            ))
+            _report("create_project")
+
+            await projects.update_project(project.id, ProjectUpdate(already_secured_funds=Decimal("250000")))
+            _report("update_project")
+
+            draft = await drafts.create_draft(ProjectDraftCreate(title="Statement count benchmark"), user_id="bench")
+            _report("create_draft")
+
+            await drafts.update_draft(draft.id, ProjectDraftUpdate(city="Pune"), user_id="bench")
+            _report("update_draft")
+        finally:
+            await db.close()
+            await outer.rollback()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -19,5 +19,7 @@ if __name__ == "__main__":
         port=port,
         reload=False,  # No auto-reload in production
         log_level="info",
+        # Each worker opens its own DB pools; workers x per-worker max connections
+        # (logged at startup, see /metrics/db-pool) must stay below Postgres max_connections
         workers=1 if is_windows else 4  # Single worker on Windows, multiple on Unix
     )
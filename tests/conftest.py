@@ -0,0 +1,8 @@
+import os
+
+# app.core.config reads the Perdix JWT from the environment at import time
+os.environ.setdefault("PERDIX_JWT", "test")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "db: needs a migrated database (TEST_DATABASE_URL)")
@@ -0,0 +1,57 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import psycopg
+
+from app.core.pagination import estimate_count
+from app.models.project import Project
+from app.services.project_service import ProjectService
+
+
+class _Result:
+    def scalar(self):
+        return [{"Plan": {"Plan Rows": 7}}]
+
+
+class _Connection:
+    dialect = psycopg.dialect()
+
+    def __init__(self):
+        self.executed = []
+
+    async def exec_driver_sql(self, statement, parameters=None):
+        self.executed.append((statement, parameters))
+        return _Result()
+
+
+class _Session:
+    def __init__(self):
+        self.conn = _Connection()
+
+    async def connection(self):
+        return self.conn
+
+
+def test_estimate_count_binds_values_containing_colon_names():
+    # "acme :x" used to be rendered into the SQL and re-parsed by text(),
+    # which read ":x" as a bind parameter and failed
+    db = _Session()
+    query = ProjectService(None).filter_projects(select(Project), organization_id="acme :x")
+
+    assert asyncio.run(estimate_count(db, query)) == 7
+
+    statement, parameters = db.conn.executed[0]
+    assert statement.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "acme" not in statement
+    assert "acme :x" in parameters.values()
+
+
+def test_estimate_count_renders_in_lists():
+    db = _Session()
+    query = select(Project).where(Project.status.in_(["active", "closed :y"]))
+
+    asyncio.run(estimate_count(db, query))
+
+    statement, parameters = db.conn.executed[0]
+    assert "POSTCOMPILE" not in statement
+    assert {"active", "closed :y"} <= set(parameters.values())
@@ -0,0 +1,55 @@
+import asyncio
+
+from sqlalchemy.dialects.postgresql import psycopg
+
+from app.services.project_search_service import ProjectSearchService
+
+
+class _Result:
+    def scalar(self):
+        return [{"Plan": {"Plan Rows": 7}}]
+
+    def all(self):
+        return []
+
+
+class _Connection:
+    dialect = psycopg.dialect()
+
+    def __init__(self):
+        self.executed = []
+
+    async def exec_driver_sql(self, statement, parameters=None):
+        self.executed.append((statement, parameters))
+        return _Result()
+
+
+class _Session:
+    def __init__(self):
+        self.conn = _Connection()
+        self.queries = []
+
+    async def connection(self):
+        return self.conn
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return _Result()
+
+
+def test_search_estimate_binds_query_text():
+    # Free text reaches the estimate's EXPLAIN; ":x" must stay a value
+    db = _Session()
+
+    page = asyncio.run(ProjectSearchService(db).search("water :x", total_mode="estimate"))
+
+    assert page.total == 7
+    assert page.items == []
+    statement, parameters = db.conn.executed[0]
+    assert statement.startswith("EXPLAIN (FORMAT JSON) SELECT")
+    assert "water" not in statement
+    assert "water :x" in parameters.values()
+
+    compiled = db.queries[0].compile(dialect=psycopg.dialect())
+    assert "water" not in compiled.string
+    assert "water :x" in compiled.params.values()